@@ -0,0 +1,1659 @@
+bl_info = {
+    "name": "Game Over Text Animator",
+    "author": "Grok",
+    "version": (1, 7, 0),
+    "blender": (3, 0, 0),
+    "location": "View3D > Sidebar > Text Animator",
+    "description": "Creates rigged 3D text with per-letter animations using a single armature",
+    "category": "Animation",
+}
+
+import bpy
+import cProfile
+import difflib
+import hashlib
+import io
+import json
+import os
+import pstats
+import shutil
+import tempfile
+import time
+import numpy as np
+from bpy.types import Operator, Panel
+from math import ceil, radians, sqrt
+from mathutils import Matrix
+import bpy_extras.anim_utils as anim_utils
+from bpy_extras.io_utils import ExportHelper
+
+from . import bake, presets
+
+# BezTriple enum values, used when writing keyframe settings with foreach_set
+KEY_INTERPOLATION = {
+    'CONSTANT': 0, 'LINEAR': 1, 'BEZIER': 2, 'BACK': 3, 'BOUNCE': 4, 'CIRC': 5, 'CUBIC': 6,
+    'ELASTIC': 7, 'EXPO': 8, 'QUAD': 9, 'QUART': 10, 'QUINT': 11, 'SINE': 12,
+}
+KEY_EASING = {'AUTO': 0, 'EASE_IN': 1, 'EASE_OUT': 2, 'EASE_IN_OUT': 3}
+KEY_HANDLE_TYPE = {'FREE': 0, 'AUTO': 1, 'VECTOR': 2, 'ALIGNED': 3, 'AUTO_CLAMPED': 4}
+
+# Interpolation stage, applied once while a preset's keys are written. Rules are
+# (data_path, array index, phase, settings); None matches anything and the first
+# matching rule wins. Keys without a rule use the user's keyframe preferences.
+KEY_STYLES = {
+    'DAYTONA': [
+        # The rotation holds between snaps are explicit steps
+        ("rotation_euler", 2, 'hold', {'interpolation': 'CONSTANT'}),
+    ],
+    'CIRCULAR_APPROACH': [
+        # Constant speed spin, for the approach and for the jump
+        ("rotation_euler", 2, None, {'interpolation': 'LINEAR'}),
+    ],
+    'BAD_GAME_OVER': [
+        (None, None, 'bounce', {'interpolation': 'BEZIER', 'handle_type': 'AUTO_CLAMPED'}),
+    ],
+}
+
+DECIMATE_RATIO = 0.1
+
+# Glyph curve settings; with the font and character they form the glyph cache key
+GLYPH_EXTRUDE = 0.05
+GLYPH_BEVEL_DEPTH = 0.02
+GLYPH_BEVEL_RESOLUTION = 5
+GLYPH_RESOLUTION_U = 12
+
+def action_channels(obj, action):
+    """Returns the F-curve container for obj on action (the channelbag of its slot on Blender 4.4+)."""
+    if not hasattr(anim_utils, "action_ensure_channelbag_for_slot"):
+        return action
+    anim_data = obj.animation_data
+    if anim_data.action_slot is None:
+        anim_data.action_slot = action.slots.new(id_type='OBJECT', name=obj.name)
+    return anim_utils.action_ensure_channelbag_for_slot(action, anim_data.action_slot)
+
+# Absolute font file path -> name of the VectorFont datablock loaded from it
+_fonts = {}
+
+def load_font(font_path):
+    """Returns the VectorFont for font_path (None for an empty path), loading the file only once.
+
+    An already loaded datablock for the same file is reused instead of piling
+    up Font.001, Font.002, ... on every run. Raises ValueError when the file is
+    missing or Blender can't read it.
+    """
+    if not font_path:
+        return None
+    path = os.path.normpath(bpy.path.abspath(font_path))
+    font = bpy.data.fonts.get(_fonts.get(path, ""))
+    if font is not None and os.path.normpath(bpy.path.abspath(font.filepath)) == path:
+        return font
+    if not os.path.isfile(path):
+        raise ValueError(f"Font file not found: {path}")
+    try:
+        font = bpy.data.fonts.load(path, check_existing=True)
+    except RuntimeError as exc:
+        raise ValueError(f"Could not load font {path}: {exc}") from exc
+    _fonts[path] = font.name
+    return font
+
+# Glyph widths measured this session, keyed by glyph_key()
+_glyph_widths = {}
+
+def glyph_key(font, c, extrude, bevel_depth, bevel_res, res_u):
+    font_path = bpy.path.abspath(font.filepath) if font else "<builtin>"
+    return (font_path, c, extrude, bevel_depth, bevel_res, res_u)
+
+def new_glyph_curve(font, c, extrude, bevel_depth, bevel_res, res_u):
+    curve = bpy.data.curves.new(name="Temp_Curve", type='FONT')
+    if font:
+        curve.font = font
+    curve.body = c
+    curve.align_x = 'CENTER'
+    curve.extrude = extrude
+    curve.bevel_depth = bevel_depth
+    curve.bevel_resolution = bevel_res
+    curve.resolution_u = res_u
+    return curve
+
+def prewarm_glyph_metrics(context, font, chars, extrude=GLYPH_EXTRUDE, bevel_depth=GLYPH_BEVEL_DEPTH,
+                          bevel_res=GLYPH_BEVEL_RESOLUTION, res_u=GLYPH_RESOLUTION_U):
+    """Measures every glyph of chars that is not cached yet with a single view layer update.
+
+    The defaults are the settings generate_title() uses, so a whole character
+    set can be measured up front. Returns the number of glyphs that had to be
+    measured.
+    """
+    missing = {}
+    for c in chars:
+        key = glyph_key(font, c, extrude, bevel_depth, bevel_res, res_u)
+        if key not in _glyph_widths and key not in missing:
+            missing[key] = c
+    if not missing:
+        return 0
+
+    temp_objs = []
+    for key, c in missing.items():
+        temp_obj = bpy.data.objects.new("Temp_Obj", new_glyph_curve(font, c, extrude, bevel_depth, bevel_res, res_u))
+        context.collection.objects.link(temp_obj)
+        temp_objs.append((key, temp_obj))
+
+    context.view_layer.update()
+    for key, temp_obj in temp_objs:
+        _glyph_widths[key] = temp_obj.dimensions.x
+        curve_data = temp_obj.data
+        bpy.data.objects.remove(temp_obj, do_unlink=True)
+        bpy.data.curves.remove(curve_data, do_unlink=True)
+    return len(missing)
+
+def get_char_width(context, font, c, extrude, bevel_depth, bevel_res, res_u):
+    prewarm_glyph_metrics(context, font, c, extrude, bevel_depth, bevel_res, res_u)
+    return _glyph_widths[glyph_key(font, c, extrude, bevel_depth, bevel_res, res_u)]
+
+def clear_glyph_metrics():
+    _glyph_widths.clear()
+
+def build_glyph_meshes(context, font, chars, extrude, bevel_depth, bevel_res, res_u):
+    """Converts each glyph of chars into a new mesh standing upright (rotated 90 degrees on X).
+
+    Uses the data API only: the temporary curve objects are evaluated with a
+    single depsgraph update, and selection, the active object and the undo
+    stack are left alone.
+    """
+    temp_objs = []
+    for c in chars:
+        temp_obj = bpy.data.objects.new("Temp_Obj", new_glyph_curve(font, c, extrude, bevel_depth, bevel_res, res_u))
+        context.collection.objects.link(temp_obj)
+        temp_objs.append(temp_obj)
+
+    depsgraph = context.evaluated_depsgraph_get()
+    upright = Matrix.Rotation(radians(90), 4, 'X')
+    meshes = []
+    for temp_obj in temp_objs:
+        mesh = bpy.data.meshes.new_from_object(temp_obj.evaluated_get(depsgraph))
+        mesh.transform(upright)
+        mesh.materials.clear()
+        meshes.append(mesh)
+
+    for temp_obj in temp_objs:
+        curve = temp_obj.data
+        bpy.data.objects.remove(temp_obj, do_unlink=True)
+        bpy.data.curves.remove(curve, do_unlink=True)
+    return meshes
+
+def center_glyph_mesh(mesh):
+    """Moves mesh so its bounds are centered on the origin and returns half its height."""
+    co = np.empty(len(mesh.vertices) * 3)
+    mesh.vertices.foreach_get("co", co)
+    co = co.reshape(-1, 3)
+    if len(co):
+        min_x, min_y, min_z = co.min(axis=0)
+        max_x, max_y, max_z = co.max(axis=0)
+    else:
+        min_x = min_y = min_z = max_x = max_y = max_z = 0.0
+
+    center_x = (min_x + max_x) / 2
+    center_y = (min_y + max_y) / 2
+    height = max_z - min_z
+    center_z = height / 2
+
+    co -= (center_x, center_y, min_z + center_z)
+    mesh.vertices.foreach_set("co", co.ravel())
+    mesh.update()
+    return float(center_z)
+
+def glyph_half_diagonal(mesh):
+    """Returns half the diagonal of mesh's bounds: the radius around a centered glyph that holds all of it."""
+    co = np.empty(len(mesh.vertices) * 3)
+    mesh.vertices.foreach_get("co", co)
+    co = co.reshape(-1, 3)
+    return float(np.linalg.norm(co.max(axis=0) - co.min(axis=0)) / 2) if len(co) else 0.0
+
+def build_merged_text(name, meshes, positions, material):
+    """Returns a new object with every glyph mesh joined into one mesh, each moved to its letter position.
+
+    The vertices of letter i form the vertex group Bone_i, so a single
+    Armature modifier deforms them exactly like per-letter objects would.
+    """
+    glyphs = {}
+    co, faces, smooth, counts = [], [], [], []
+    offset = 0
+    for mesh, x in zip(meshes, positions):
+        glyph = glyphs.get(mesh.name)
+        if glyph is None:
+            verts = np.empty(len(mesh.vertices) * 3)
+            mesh.vertices.foreach_get("co", verts)
+            loops = np.empty(len(mesh.loops), dtype=np.int64)
+            mesh.loops.foreach_get("vertex_index", loops)
+            starts = np.empty(len(mesh.polygons), dtype=np.int64)
+            mesh.polygons.foreach_get("loop_start", starts)
+            flags = np.empty(len(mesh.polygons), dtype=bool)
+            mesh.polygons.foreach_get("use_smooth", flags)
+            glyph = glyphs[mesh.name] = (verts.reshape(-1, 3), np.split(loops, starts[1:]) if len(starts) else [], flags)
+        verts, polygons, flags = glyph
+        co.append(verts + (x, 0.0, 0.0))
+        faces.extend(polygon + offset for polygon in polygons)
+        smooth.append(flags)
+        counts.append(len(verts))
+        offset += len(verts)
+
+    merged = bpy.data.meshes.new(name)
+    merged.from_pydata(np.concatenate(co) if co else [], [], faces)
+    if smooth:
+        merged.polygons.foreach_set("use_smooth", np.concatenate(smooth))
+    merged.materials.append(material)
+    merged.update()
+
+    obj = bpy.data.objects.new(name, merged)
+    start = 0
+    for i, count in enumerate(counts):
+        obj.vertex_groups.new(name=f"Bone_{i}").add(range(start, start + count), 1.0, 'REPLACE')
+        start += count
+    return obj
+
+def add_decimate_modifier(obj):
+    dec_mod = obj.modifiers.new(name="Decimate", type='DECIMATE')
+    dec_mod.ratio = DECIMATE_RATIO
+    dec_mod.decimate_type = 'COLLAPSE'
+    dec_mod.use_collapse_triangulate = True
+    return dec_mod
+
+def decimate_meshes(context, meshes):
+    """Returns a decimated copy of each mesh and removes the originals.
+
+    The Decimate modifier is evaluated once on temporary objects, all of
+    them in a single depsgraph update.
+    """
+    temp_objs = []
+    for mesh in meshes:
+        temp_obj = bpy.data.objects.new("Temp_Obj", mesh)
+        add_decimate_modifier(temp_obj)
+        context.collection.objects.link(temp_obj)
+        temp_objs.append(temp_obj)
+
+    depsgraph = context.evaluated_depsgraph_get()
+    reduced = []
+    for temp_obj in temp_objs:
+        reduced.append(bpy.data.meshes.new_from_object(temp_obj.evaluated_get(depsgraph)))
+
+    for temp_obj in temp_objs:
+        mesh = temp_obj.data
+        bpy.data.objects.remove(temp_obj, do_unlink=True)
+        bpy.data.meshes.remove(mesh, do_unlink=True)
+    return reduced
+
+# Decimated glyph meshes by LOD key, as (mesh name, half height)
+_glyph_lods = {}
+
+def glyph_lod_key(font, c, extrude, bevel_depth, bevel_res, res_u):
+    key = glyph_key(font, c, extrude, bevel_depth, bevel_res, res_u) + (DECIMATE_RATIO,)
+    return "|".join(str(part) for part in key)
+
+def _find_glyph_lod(lod_key):
+    """Returns the cached LOD mesh of lod_key, or None when the index has no valid entry for it."""
+    entry = _glyph_lods.get(lod_key)
+    if entry is not None:
+        mesh = bpy.data.meshes.get(entry[0])
+        if mesh is not None and mesh.get("text_anim_lod") == lod_key:
+            return mesh
+    return None
+
+def _rebuild_glyph_lod_index():
+    # Undo, renames or a freshly opened file invalidate the index, so rebuild it from the tags
+    _glyph_lods.clear()
+    for mesh in bpy.data.meshes:
+        tag = mesh.get("text_anim_lod")
+        if tag is not None:
+            _glyph_lods[tag] = (mesh.name, mesh["text_anim_center_z"])
+
+def get_glyph_lods_steps(context, font, chars, material, extrude, bevel_depth, bevel_res, res_u):
+    """Returns {char: (mesh, half height)} with a centered, decimated mesh for each glyph of chars.
+
+    Meshes come from the LOD cache when an earlier run already reduced the
+    glyph with the same font and bevel settings; only the missing glyphs are
+    converted and decimated, in slices, yielding the fraction done. Cached
+    meshes keep a fake user (and are saved with the .blend) so later runs and
+    sessions can reuse them.
+    """
+    lods = {}
+    missing = []
+    rebuilt = False
+    for c in dict.fromkeys(chars):
+        lod_key = glyph_lod_key(font, c, extrude, bevel_depth, bevel_res, res_u)
+        mesh = _find_glyph_lod(lod_key)
+        if mesh is None and not rebuilt:
+            # One rescan of the file per call, however many glyphs are missing
+            _rebuild_glyph_lod_index()
+            rebuilt = True
+            mesh = _find_glyph_lod(lod_key)
+        if mesh is None:
+            missing.append(c)
+        else:
+            lods[c] = (mesh, mesh["text_anim_center_z"])
+
+    def reduce(part):
+        meshes = build_glyph_meshes(context, font, part, extrude, bevel_depth, bevel_res, res_u)
+        centers_z = [center_glyph_mesh(mesh) for mesh in meshes]
+        return zip(decimate_meshes(context, meshes), centers_z)
+
+    if missing:
+        reduced = yield from in_slices(missing, reduce)
+        for c, (mesh, center_z) in zip(missing, reduced):
+            lod_key = glyph_lod_key(font, c, extrude, bevel_depth, bevel_res, res_u)
+            mesh.name = f"Glyph_{c}"
+            mesh.use_fake_user = True
+            mesh["text_anim_lod"] = lod_key
+            mesh["text_anim_center_z"] = center_z
+            _glyph_lods[lod_key] = (mesh.name, center_z)
+            lods[c] = (mesh, center_z)
+
+    for mesh, _ in lods.values():
+        if list(mesh.materials) != [material]:
+            mesh.materials.clear()
+            mesh.materials.append(material)
+    return lods
+
+def read_title_state(empty):
+    """Returns what generate_title() recorded on a group empty, or None if it isn't a generated title."""
+    if empty is None or "text_anim_state" not in empty:
+        return None
+    return json.loads(empty["text_anim_state"])
+
+def write_title_state(empty, state):
+    empty["text_anim_state"] = json.dumps(state)
+
+VISIBILITY_PATHS = ("hide_viewport", "hide_render")
+
+def key_visibility(obj, frames, hidden):
+    """Keys obj's hide_viewport and hide_render to hidden[k] at frames[k], only where the value changes."""
+    changes = np.flatnonzero(np.concatenate(([True], hidden[1:] != hidden[:-1])))
+    co = np.empty(len(changes) * 2)
+    co[0::2] = frames[changes]
+    co[1::2] = hidden[changes]
+    anim_data = obj.animation_data_create()
+    if anim_data.action is None:
+        anim_data.action = bpy.data.actions.new(name=f"{obj.name}Action")
+    channels = action_channels(obj, anim_data.action)
+    for data_path in VISIBILITY_PATHS:
+        fc = channels.fcurves.new(data_path)
+        fc.keyframe_points.add(len(changes))
+        fc.keyframe_points.foreach_set("co", co)
+        fc.keyframe_points.foreach_set("interpolation", np.full(len(changes), KEY_INTERPOLATION['CONSTANT']))
+        fc.update()
+    return anim_data.action
+
+def clear_visibility_keys(obj):
+    """Removes the chunk visibility action of a letter and shows it again."""
+    action = obj.animation_data.action if obj.animation_data else None
+    if action is not None:
+        obj.animation_data_clear()
+        if action.users == 0:
+            bpy.data.actions.remove(action)
+    obj.hide_viewport = obj.hide_render = False
+
+def remove_objects(objs):
+    """Removes objs and the meshes and actions only they used. Cached glyph meshes keep their fake user."""
+    data = {obj.data for obj in objs if obj.data is not None}
+    data.update(obj.animation_data.action for obj in objs if obj.animation_data and obj.animation_data.action)
+    bpy.data.batch_remove(list(objs))
+    bpy.data.batch_remove([block for block in data if block.users == 0])
+
+def reuse_title_letters(state, letter_chars, settings):
+    """Matches the letters of an earlier generation against letter_chars.
+
+    Returns {new index: (letter object, center z)} for the letters that keep
+    their glyph, and removes the other letters with the meshes and actions
+    only they used. Nothing is kept when the font or geometry settings
+    changed. A merged text mesh is always removed.
+    """
+    old_letters = [bpy.data.objects.get(name) for name in state["letters"]]
+    old_letters.append(bpy.data.objects.get(state.get("mesh", "")))
+    kept = {}
+    if state["settings"] == settings:
+        matcher = difflib.SequenceMatcher(None, state["glyphs"], "".join(letter_chars), autojunk=False)
+        for i, j, size in matcher.get_matching_blocks():
+            for k in range(size):
+                letter = old_letters[i + k] if i + k < len(state["letters"]) else None
+                if letter is not None:
+                    kept[j + k] = (letter, state["centers"][i + k])
+    keep = {letter for letter, _ in kept.values()}
+    remove_objects([letter for letter in old_letters if letter is not None and letter not in keep])
+    return kept
+
+class KeyframeBuffer:
+    """Collects pose bone keyframes and writes every F-curve in one bulk pass.
+
+    Keys are added per bone channel as arrays; like PoseBone.keyframe_insert,
+    a later key on the same frame replaces the earlier one. Keys can be tagged
+    with a phase name that the interpolation rules in KEY_STYLES match on.
+    Nothing touches the action until write_steps().
+    """
+
+    def __init__(self):
+        self.channels = {}
+        self.removed = 0
+        self._paths = {}
+
+    def _path(self, bone, data_path):
+        key = (bone.name, data_path)
+        path = self._paths.get(key)
+        if path is None:
+            path = self._paths[key] = bone.path_from_id(data_path)
+        return path
+
+    def extend(self, bone, data_path, index, frames, values, phases=None):
+        """Appends keys for channel index of bone's data_path. phases is a phase name per key."""
+        path = self._path(bone, data_path)
+        channel = self.channels.get((bone.name, path, index))
+        if channel is None:
+            channel = self.channels[(bone.name, path, index)] = (data_path, [], [], [])
+        channel[1].append(np.asarray(frames, dtype=float))
+        channel[2].append(np.asarray(values, dtype=float))
+        channel[3].append(np.full(len(frames), None, dtype=object) if phases is None else np.asarray(phases, dtype=object))
+
+    def write_steps(self, obj, styles=(), tolerance=0.0):
+        """Creates the F-curves on obj's action and fills them. Returns the number of keys written.
+
+        styles are the interpolation rules of the preset (see KEY_STYLES),
+        resolved once per channel and phase instead of patched in afterwards.
+
+        With a tolerance, densely sampled channels are thinned out: keys are
+        left out as long as the resulting curve passes within tolerance of
+        every key that was left out. Channels with phase-specific interpolation
+        are kept as they are. The number of keys left out is added to removed.
+
+        F-curves are filled one at a time, yielding the fraction done.
+        """
+        anim_data = obj.animation_data_create()
+        if anim_data.action is None:
+            anim_data.action = bpy.data.actions.new(name=f"{obj.name}Action")
+        channels = action_channels(obj, anim_data.action)
+        edit_prefs = bpy.context.preferences.edit
+        defaults = {
+            'interpolation': edit_prefs.keyframe_new_interpolation_type,
+            'easing': 'AUTO',
+            'handle_type': edit_prefs.keyframe_new_handle_type,
+        }
+        resolved = {}
+
+        written = 0
+        for n, ((group_name, path, index), (data_path, frames, values, phases)) in enumerate(self.channels.items(), 1):
+            fc = channels.fcurves.find(path, index=index)
+            if fc is None:
+                fc = channels.fcurves.new(path, index=index)
+                group = channels.groups.get(group_name) or channels.groups.new(group_name)
+                fc.group = group
+            elif len(fc.keyframe_points):
+                # Merge into the existing keys the same way keyframe_insert would
+                existing = np.empty(len(fc.keyframe_points) * 2, dtype=np.float32)
+                fc.keyframe_points.foreach_get("co", existing)
+                frames = [existing[0::2].astype(float)] + frames
+                values = [existing[1::2].astype(float)] + values
+                phases = [np.full(len(existing) // 2, None, dtype=object)] + phases
+                fc.keyframe_points.clear()
+            frames, values, phases = np.concatenate(frames), np.concatenate(values), np.concatenate(phases)
+
+            # The last key on a frame wins; np.unique finds the first of the reversed keys
+            unique_frames, first = np.unique(frames[::-1], return_index=True)
+            last = len(frames) - 1 - first
+            count = len(unique_frames)
+            key_values = values[last]
+            key_phases = phases[last]
+            used_phases = set(key_phases.tolist())
+            keep = None
+            if tolerance > 0 and count > 2 and used_phases == {None}:
+                keep = presets.reduce_keys(unique_frames, key_values, tolerance)
+                count = int(keep.sum())
+            co = np.empty(count * 2, dtype=np.float32)
+            co[0::2] = unique_frames if keep is None else unique_frames[keep]
+            co[1::2] = key_values if keep is None else key_values[keep]
+            key_phases = key_phases if keep is None else key_phases[keep]
+            ipo, easing, handle = (np.empty(count, dtype=np.int32) for _ in range(3))
+            for phase in used_phases:
+                settings = resolved.get((data_path, index, phase))
+                if settings is None:
+                    settings = resolved[(data_path, index, phase)] = key_settings(styles, defaults, data_path, index, phase)
+                selected = np.equal(key_phases, phase)
+                ipo[selected], easing[selected], handle[selected] = settings
+
+            points = fc.keyframe_points
+            points.add(count)
+            points.foreach_set("co", co)
+            points.foreach_set("interpolation", ipo)
+            points.foreach_set("easing", easing)
+            points.foreach_set("handle_left_type", handle)
+            points.foreach_set("handle_right_type", handle)
+            fc.update()
+            if keep is not None:
+                left_out = restore_worst_keys(fc, unique_frames, key_values, np.flatnonzero(~keep), tolerance,
+                                              resolved[(data_path, index, None)])
+                count = len(unique_frames) - left_out
+                self.removed += left_out
+            written += count
+            yield n / len(self.channels)
+        return written
+
+def restore_worst_keys(fc, frames, values, dropped, tolerance, settings):
+    """Re-inserts the dropped keys of fc, worst first, until fc passes within tolerance of all of them.
+
+    Restored keys get settings, the channel's (interpolation, easing, handle
+    type) enum values from key_settings(). Returns the number of keys that
+    stay dropped.
+    """
+    interpolation, easing, handle = (next(name for name, value in names.items() if value == setting)
+                                     for names, setting in zip((KEY_INTERPOLATION, KEY_EASING, KEY_HANDLE_TYPE), settings))
+    dropped = list(dropped)
+    while dropped:
+        errors = [abs(fc.evaluate(frames[i]) - values[i]) for i in dropped]
+        worst = max(range(len(dropped)), key=errors.__getitem__)
+        if errors[worst] <= tolerance:
+            break
+        i = dropped.pop(worst)
+        point = fc.keyframe_points.insert(frames[i], values[i], options={'FAST'})
+        point.interpolation = interpolation
+        point.easing = easing
+        point.handle_left_type = point.handle_right_type = handle
+        fc.update()
+    return len(dropped)
+
+def key_settings(styles, defaults, data_path, index, phase):
+    """Returns the (interpolation, easing, handle type) enum values for keys of one channel and phase."""
+    settings = dict(defaults)
+    for rule_path, rule_index, rule_phase, rule in styles:
+        if rule_path in (None, data_path) and rule_index in (None, index) and rule_phase in (None, phase):
+            settings.update(rule)
+            break
+    return (
+        KEY_INTERPOLATION.get(settings['interpolation'], KEY_INTERPOLATION['BEZIER']),
+        KEY_EASING.get(settings['easing'], KEY_EASING['AUTO']),
+        KEY_HANDLE_TYPE.get(settings['handle_type'], KEY_HANDLE_TYPE['AUTO_CLAMPED']),
+    )
+
+def write_motion(motion, bones, keys):
+    """Feeds a presets.Motion into keys, bone by bone and channel by channel.
+
+    keys is a KeyframeBuffer, or a list with the buffer of each bone when
+    the bones belong to several armatures. This keeps the F-curve order of
+    each action the same as when every bone was keyed on its own.
+    """
+    channels = motion.channels()
+    edges = {channel: np.searchsorted(letters, np.arange(len(bones) + 1))
+             for channel, (letters, _frames, _values, _phases) in channels.items()}
+    for b, bone in enumerate(bones):
+        for (data_path, index), (_letters, frames, values, phases) in channels.items():
+            lo, hi = edges[(data_path, index)][b:b + 2]
+            if lo < hi:
+                (keys[b] if isinstance(keys, list) else keys).extend(bone, data_path, index, frames[lo:hi], values[lo:hi], phases[lo:hi])
+
+# Seconds of work per step of an interactive generation (see TEXT_ANIM_OT_run_steps)
+STEP_BUDGET = 1 / 30
+
+def run_steps(steps):
+    """Runs a generator of progress steps to the end and returns its return value."""
+    while True:
+        try:
+            next(steps)
+        except StopIteration as finished:
+            return finished.value
+
+def scale_progress(steps, start, end):
+    """Yields the 0 to 1 progress of steps mapped onto start to end, and returns its return value."""
+    while True:
+        try:
+            done = next(steps)
+        except StopIteration as finished:
+            return finished.value
+        yield start + (end - start) * done
+
+def in_slices(items, work, budget=STEP_BUDGET):
+    """Calls work on consecutive slices of items and yields the fraction done after each slice.
+
+    The first slice holds one item; later slices are sized from the time work
+    took so far so that each takes about budget seconds, which keeps batched
+    depsgraph updates bounded. Returns the concatenated results of work.
+    """
+    results = []
+    done, size = 0, 1
+    while done < len(items):
+        began = time.perf_counter()
+        results.extend(work(items[done:done + size]))
+        elapsed = time.perf_counter() - began
+        done += size
+        # Grow at most fourfold so one quick slice can't make the next one huge
+        size = max(1, min(size * 4, int(size * budget / elapsed))) if elapsed > 0 else size * 4
+        yield done / len(items)
+    return results
+
+class GenerationStats:
+    """Wall time per stage of a generation and counts of the work it did.
+
+    stage() starts the next stage and ends the running one; stop() ends the last.
+    """
+
+    def __init__(self):
+        self.timings = {}
+        self.counts = {}
+        self._stage = None
+        self._paused = None
+        self._started = 0.0
+
+    def stage(self, name):
+        now = time.perf_counter()
+        if self._stage is not None:
+            self.timings[self._stage] = self.timings.get(self._stage, 0.0) + now - self._started
+        self._stage, self._started = name, now
+
+    def stop(self):
+        self.stage(None)
+
+    def pause(self):
+        """Stops the clock of the running stage until resume()."""
+        self._paused = self._stage
+        self.stage(None)
+
+    def resume(self):
+        self.stage(self._paused)
+
+    def count(self, name, n=1):
+        self.counts[name] = self.counts.get(name, 0) + n
+
+    def as_dict(self):
+        return {
+            "total": round(sum(self.timings.values()), 6),
+            "timings": {name: round(seconds, 6) for name, seconds in self.timings.items()},
+            "counts": dict(self.counts),
+        }
+
+    def summary(self):
+        timings = ", ".join(f"{name} {seconds:.3f}s" for name, seconds in self.timings.items())
+        counts = ", ".join(f"{n} {name}" for name, n in self.counts.items())
+        return f"{sum(self.timings.values()):.3f}s ({timings}); {counts}"
+
+class ActionCache:
+    """On-disk library of generated actions, one <key>.blend per action.
+
+    The key hashes everything the keyframes depend on: the preset and its
+    timing constants, the letter count, the seed of random presets, the key
+    reduction tolerance and the interpolation settings. No preset reads the
+    letter positions, so titles of the same length share an action whatever
+    their glyphs. Files are written atomically so several Blender processes
+    can share a directory. Once the files exceed max_bytes the least
+    recently used ones are deleted.
+    """
+
+    # Bump when the keys written for the same inputs change
+    VERSION = 3
+
+    def __init__(self, directory, max_bytes=256 * 2**20):
+        self.directory = bpy.path.abspath(directory)
+        self.max_bytes = max_bytes
+
+    def key(self, anim_type, num_letters, seed, tolerance=0.0):
+        edit_prefs = bpy.context.preferences.edit
+        payload = {
+            "version": self.VERSION,
+            "preset": anim_type,
+            "parameters": presets.parameters(anim_type),
+            "letters": num_letters,
+            "seed": seed if anim_type in RANDOM_ANIMATION_TYPES else 0,
+            "tolerance": tolerance,
+            "styles": KEY_STYLES.get(anim_type, ()),
+            "defaults": [edit_prefs.keyframe_new_interpolation_type, edit_prefs.keyframe_new_handle_type],
+        }
+        return hashlib.sha1(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.blend")
+
+    def load(self, key):
+        """Appends the cached action for key. Returns it, or None on a miss.
+
+        Another process may evict the file at any moment; that counts as a miss.
+        """
+        path = self._path(key)
+        if not os.path.isfile(path):
+            return None
+        try:
+            with bpy.data.libraries.load(path, link=False) as (data_from, data_to):
+                data_to.actions = list(data_from.actions[:1])
+        except OSError:
+            return None
+        if not data_to.actions or data_to.actions[0] is None:
+            return None
+        action = data_to.actions[0]
+        action.use_fake_user = False
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return action
+
+    def store(self, key, action):
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(key)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        bpy.data.libraries.write(temp_path, {action}, fake_user=True)
+        os.replace(temp_path, path)
+        self.evict()
+
+    def evict(self):
+        """Deletes the least recently used files until the cache fits in max_bytes."""
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".blend") and entry.is_file():
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+
+def assign_action(obj, action):
+    anim_data = obj.animation_data_create()
+    anim_data.action = action
+    if hasattr(anim_data, "action_slot") and anim_data.action_slot is None and len(action.slots):
+        anim_data.action_slot = action.slots[0]
+
+def generate_title(context, text, font=None, anim_type='DAYTONA', extra_spacing=0.0,
+                   geometry='UNIQUE', apply_decimate=False, collection=None, update=None, stats=None, seed=0,
+                   cache=None, key_tolerance=0.0, chunk_size=0):
+    """Builds, rigs and animates text in collection (the active collection by default).
+
+    font is a loaded VectorFont, or None for Blender's built-in font. The
+    scene frame range and frame rate are set to fit the animation. Returns the
+    GameOver_Text_Group empty the rig is parented to. seed picks the random
+    variation of the DIGITAL_GLITCH, SLINGSHOT_SNAP and ARCADE_SLAM presets;
+    the same seed always gives the same animation.
+
+    A key_tolerance above 0 thins out densely sampled curves, see
+    KeyframeBuffer.write_steps.
+
+    With cache (an ActionCache) the action is taken from the cache when the
+    same preset was generated for the same number of letters before, and
+    stored in it otherwise. The cache only applies to titles with a single
+    armature.
+
+    A chunk_size above 0 splits the rig into armatures of at most that many
+    bones, TextArmature_0, TextArmature_1 and so on, and keys each chunk and
+    its letters hidden on the frames where none of its letters can be seen
+    (see cull_title_chunks_steps). Merged geometry always keeps one armature.
+
+    With update set to the group empty of an earlier generation, that title is
+    changed in place: letters whose glyph survives the edit keep their object
+    and mesh and are only moved and re-keyed, only new glyphs are built, and
+    the letters and action that are no longer needed are removed.
+
+    The time spent per stage and the amount of work done are collected in
+    stats (a GenerationStats) and stored as JSON in the empty's
+    "text_anim_stats" property.
+    """
+    return run_steps(generate_title_steps(context, text, font, anim_type, extra_spacing, geometry, apply_decimate,
+                                          collection, update, stats, seed, cache, key_tolerance, chunk_size))
+
+def generate_title_steps(context, text, font=None, anim_type='DAYTONA', extra_spacing=0.0,
+                         geometry='UNIQUE', apply_decimate=False, collection=None, update=None, stats=None, seed=0,
+                         cache=None, key_tolerance=0.0, chunk_size=0):
+    """generate_title() as a generator that yields its progress, from 0 to 1, between bounded pieces of work.
+
+    Each piece handles one letter, one F-curve, one culled frame or a slice
+    of glyphs to measure, convert or decimate sized to take about
+    STEP_BUDGET seconds (see in_slices). Only the edit mode session and the
+    preset evaluation run whole. The group empty is the generator's return
+    value.
+    """
+    stats = GenerationStats() if stats is None else stats
+    stats.stage("layout")
+    text = text.upper()
+    state = read_title_state(update)
+    if collection is None:
+        collection = update.users_collection[0] if state else context.collection
+
+    extrude = GLYPH_EXTRUDE
+    bevel_depth = GLYPH_BEVEL_DEPTH
+    bevel_res = GLYPH_BEVEL_RESOLUTION
+    res_u = GLYPH_RESOLUTION_U
+
+    context.scene.render.fps = 60
+    context.scene.render.fps_base = 1
+
+    # --- 1. Calculate Positions ---
+    chars = list(text)
+    letter_chars = [c for c in chars if not c.isspace()]
+    positions = []
+    current_x = 0.0
+    measured = yield from scale_progress(in_slices(list(dict.fromkeys(chars)), lambda part: [
+        prewarm_glyph_metrics(context, font, part, extrude, bevel_depth, bevel_res, res_u)]), 0.0, 0.05)
+    stats.count("glyphs measured", sum(measured))
+
+    for c in chars:
+        width = get_char_width(context, font, c, extrude, bevel_depth, bevel_res, res_u)
+        if not c.isspace():
+            positions.append(current_x + width / 2)
+        current_x += width + extra_spacing
+
+    total_width = current_x - extra_spacing
+    start_x = -total_width / 2
+    positions = [start_x + p for p in positions]
+    yield 0.05
+
+    # --- Material Setup ---
+    stats.stage("material")
+    mat_name = "GameOver_Text_Mat"
+    common_mat = bpy.data.materials.get(mat_name)
+    if not common_mat:
+        common_mat = bpy.data.materials.new(name=mat_name)
+        common_mat.use_nodes = True
+
+    # --- 2. Glyph Meshes ---
+    stats.stage("objects")
+    settings = glyph_lod_key(font, "", extrude, bevel_depth, bevel_res, res_u) + f"|{geometry}|{apply_decimate}"
+    kept = reuse_title_letters(state, letter_chars, settings) if state else {}
+    for letter, _ in kept.values():
+        # Step aside so the final names below are free
+        letter.name = "Letter_tmp"
+        if geometry == 'UNIQUE':
+            letter.data.name = "Char_tmp"
+        clear_visibility_keys(letter)
+    new_indices = [i for i in range(len(letter_chars)) if i not in kept]
+    new_chars = [letter_chars[i] for i in new_indices]
+
+    pre_decimated = geometry != 'UNIQUE' or apply_decimate
+    if pre_decimated:
+        # Decimated once per distinct glyph; the LOD cache keeps them for later runs
+        lods = yield from scale_progress(get_glyph_lods_steps(context, font, new_chars, common_mat, extrude, bevel_depth,
+                                                              bevel_res, res_u), 0.05, 0.25)
+        new_centers = [lods[c][1] for c in new_chars]
+        if geometry != 'UNIQUE':
+            meshes = [lods[c][0] for c in new_chars]
+        else:
+            meshes = []
+            for c in new_chars:
+                mesh = lods[c][0].copy()
+                mesh.use_fake_user = False
+                del mesh["text_anim_lod"]
+                meshes.append(mesh)
+    else:
+        meshes = yield from scale_progress(in_slices(new_chars, lambda part: build_glyph_meshes(
+            context, font, part, extrude, bevel_depth, bevel_res, res_u)), 0.05, 0.25)
+        new_centers = [center_glyph_mesh(mesh) for mesh in meshes]
+        for mesh in meshes:
+            mesh.materials.append(common_mat)
+    yield 0.25
+
+    # --- 3. Create Objects ---
+    letter_objs = [None] * len(letter_chars)
+    centers_z = [0.0] * len(letter_chars)
+    text_obj = None
+    if geometry == 'MERGED':
+        # Nothing is kept for a merged mesh, so new_indices covers every letter
+        text_obj = build_merged_text("TextMesh", meshes, positions, common_mat)
+        collection.objects.link(text_obj)
+        letter_objs = []
+        centers_z = new_centers
+        new_indices = []
+    for i, (letter, center_z) in kept.items():
+        letter_objs[i] = letter
+        centers_z[i] = center_z
+    for n, (i, mesh, center_z) in enumerate(zip(new_indices, meshes, new_centers), 1):
+        letter_obj = bpy.data.objects.new(f"Letter_{i}", mesh)
+        collection.objects.link(letter_obj)
+        if not pre_decimated:
+            add_decimate_modifier(letter_obj)
+        letter_objs[i] = letter_obj
+        centers_z[i] = center_z
+        yield 0.25 + 0.15 * n / len(new_indices)
+    for i, letter in enumerate(letter_objs):
+        letter.name = f"Letter_{i}"
+        if geometry == 'UNIQUE':
+            letter.data.name = f"Char_{i}"
+        letter.location = (positions[i], 0, 0)
+
+    stats.count("vertices", sum(len(obj.data.vertices) for obj in letter_objs + [text_obj] if obj is not None))
+
+    # --- 4. Rigging ---
+    stats.stage("rigging")
+    chunk = chunk_size if chunk_size > 0 and geometry != 'MERGED' else max(len(letter_chars), 1)
+    chunks = [range(start, min(start + chunk, len(letter_chars))) for start in range(0, len(letter_chars), chunk)] or [range(0)]
+    old_armatures = [bpy.data.objects.get(name) for name in state["armatures"]] if state else []
+    arm_objs = []
+    for c in range(len(chunks)):
+        arm_obj = old_armatures[c] if c < len(old_armatures) else None
+        name = "TextArmature" if len(chunks) == 1 else f"TextArmature_{c}"
+        if arm_obj is None or arm_obj.type != 'ARMATURE':
+            arm_obj = bpy.data.objects.new(name, bpy.data.armatures.new(name))
+            collection.objects.link(arm_obj)
+        else:
+            # The chunk count may have changed since the armature was named
+            arm_obj.name = arm_obj.data.name = name
+            old_action = arm_obj.animation_data.action if arm_obj.animation_data else None
+            if old_action is not None:
+                arm_obj.animation_data.action = None
+                if old_action.users == 0:
+                    bpy.data.actions.remove(old_action)
+            # The old action may have left the chunk hidden
+            arm_obj.hide_viewport = arm_obj.hide_render = False
+        arm_objs.append(arm_obj)
+    surplus = [arm_obj for arm_obj in old_armatures[len(chunks):] if arm_obj is not None and arm_obj not in arm_objs]
+    remove_objects(surplus)
+    stats.count("armatures", len(arm_objs))
+
+    if geometry == 'MERGED':
+        mod = text_obj.modifiers.new("Armature", 'ARMATURE')
+        mod.object = arm_objs[0]
+    elif geometry == 'UNIQUE':
+        for i, letter in enumerate(letter_objs):
+            mod = letter.modifiers.get("Armature") or letter.modifiers.new("Armature", 'ARMATURE')
+            mod.object = arm_objs[i // chunk]
+            if letter.vertex_groups:
+                letter.vertex_groups[0].name = f"Bone_{i}"
+            else:
+                vgroup = letter.vertex_groups.new(name=f"Bone_{i}")
+                vgroup.add(range(len(letter.data.vertices)), 1.0, 'REPLACE')
+            yield 0.4 + 0.2 * (i + 1) / len(letter_objs)
+
+    # All bones of all chunks are created in one multi-object edit mode session,
+    # already at their letter's center
+    stats.stage("armature")
+    bpy.ops.object.select_all(action='DESELECT')
+    for arm_obj in arm_objs:
+        arm_obj.select_set(True)
+    context.view_layer.objects.active = arm_objs[0]
+    bpy.ops.object.mode_set(mode='EDIT')
+    for arm_obj, letters in zip(arm_objs, chunks):
+        armature = arm_obj.data
+        for ebone in list(armature.edit_bones):
+            armature.edit_bones.remove(ebone)
+        for i in letters:
+            ebone = armature.edit_bones.new(f"Bone_{i}")
+            ebone.head = (positions[i], 0, centers_z[i])
+            ebone.tail = (positions[i], 0, centers_z[i] + 0.05)
+    bpy.ops.object.mode_set(mode='OBJECT')
+    stats.stage("rigging")
+    yield 0.65
+
+    if geometry == 'INSTANCED':
+        # Shared meshes can't carry per-letter vertex groups, so letters follow their bone
+        # as children. The parent inverse cancels the rest pose, which moves them exactly
+        # like a fully weighted Armature modifier would.
+        for i, letter in enumerate(letter_objs):
+            arm_obj = arm_objs[i // chunk]
+            bone = arm_obj.data.bones[f"Bone_{i}"]
+            letter.parent = arm_obj
+            letter.parent_type = 'BONE'
+            letter.parent_bone = bone.name
+            letter.matrix_parent_inverse = (bone.matrix_local @ Matrix.Translation((0, bone.length, 0))).inverted()
+            yield 0.65 + 0.05 * (i + 1) / len(letter_objs)
+
+    # --- 5. Animation ---
+    stats.stage("animation")
+    bones = [arm_objs[i // chunk].pose.bones[f"Bone_{i}"] for i in range(len(letter_chars))]
+    stats.count("bones", len(bones))
+
+    if state:
+        empty = update
+    else:
+        empty = bpy.data.objects.new("GameOver_Text_Group", None)
+        collection.objects.link(empty)
+        empty.location = (0, 0, 0)
+    for arm_obj in arm_objs:
+        arm_obj.parent = empty
+
+    for bone in bones:
+        bone.rotation_mode = 'XYZ'
+    if len(arm_objs) > 1:
+        cache = None
+    cache_key = cache.key(anim_type, len(positions), seed, key_tolerance) if cache else None
+    action = cache.load(cache_key) if cache else None
+    if action is not None:
+        action.name = f"{arm_objs[0].name}Action"
+        assign_action(arm_objs[0], action)
+        frame_end = action["text_anim_frame_end"]
+        stats.count("cache hits")
+    else:
+        motion = presets.evaluate(anim_type, len(bones), np.array(positions), seed)
+        buffers = [KeyframeBuffer() for _ in arm_objs]
+        write_motion(motion, bones, [buffers[i // chunk] for i in range(len(bones))])
+        yield 0.75
+        for c, (arm_obj, keys) in enumerate(zip(arm_objs, buffers)):
+            written = yield from scale_progress(keys.write_steps(arm_obj, KEY_STYLES.get(anim_type, ()), key_tolerance),
+                                                0.75 + 0.2 * c / len(arm_objs), 0.75 + 0.2 * (c + 1) / len(arm_objs))
+            stats.count("keyframes", written)
+            stats.count("F-curves", len(keys.channels))
+            if key_tolerance > 0:
+                stats.count("keys removed", keys.removed)
+        frame_end = motion.frame_end
+        if cache:
+            action = arm_objs[0].animation_data.action
+            action["text_anim_frame_end"] = frame_end
+            cache.store(cache_key, action)
+
+    stats.stage("finalize")
+    half_diagonals = {}
+    for letter in letter_objs:
+        if letter.data.name not in half_diagonals:
+            half_diagonals[letter.data.name] = glyph_half_diagonal(letter.data)
+    write_title_state(empty, {
+        "text": text,
+        "glyphs": "".join(letter_chars),
+        "settings": settings,
+        "armatures": [arm_obj.name for arm_obj in arm_objs],
+        "chunk": chunk,
+        "letters": [letter.name for letter in letter_objs],
+        "mesh": text_obj.name if text_obj else "",
+        "centers": centers_z,
+        "extents": [half_diagonals[letter.data.name] for letter in letter_objs],
+        "seed": seed,
+    })
+
+    context.scene.frame_end = frame_end + 50
+    if chunk_size > 0 and geometry != 'MERGED':
+        stats.stage("culling")
+        hidden = yield from scale_progress(cull_title_chunks_steps(context, empty), 0.95, 1.0)
+        stats.count("hidden chunk frames", hidden)
+    context.scene.frame_current = 1
+    stats.stop()
+    empty["text_anim_stats"] = json.dumps(stats.as_dict())
+    return empty
+
+def title_bone_order(state, collections):
+    """Returns the row of each letter's Bone_i when the bone collections are read one after the other."""
+    rows = {bone.name: k for k, bone in enumerate(bone for bones in collections for bone in bones)}
+    return [rows[f"Bone_{i}"] for i in range(len(state["glyphs"]))]
+
+def read_pose_channels(collections, out):
+    """Fills out, of shape (bones, 9), with the bake.CHANNELS of every pose bone in collections."""
+    start = 0
+    for pose_bones in collections:
+        buf = np.empty(len(pose_bones) * 3, dtype=np.float32)
+        for c, data_path in enumerate(bake.CHANNELS):
+            pose_bones.foreach_get(data_path, buf)
+            out[start:start + len(pose_bones), 3 * c:3 * c + 3] = buf.reshape(-1, 3)
+        start += len(pose_bones)
+
+def title_rest_matrices(state):
+    """Returns the armature-space rest matrices of a title's bones, shape (letters, 4, 4) in letter order."""
+    collections = [bpy.data.objects[name].data.bones for name in state["armatures"]]
+    rest = []
+    for bones in collections:
+        flat = np.empty(len(bones) * 16, dtype=np.float32)
+        bones.foreach_get("matrix_local", flat)
+        # foreach_get flattens matrices column by column
+        rest.append(flat.reshape(-1, 4, 4).transpose(0, 2, 1))
+    return np.concatenate(rest)[title_bone_order(state, collections)]
+
+def mute_culling(state, mute=True):
+    """Mutes or unmutes the chunk visibility keys of a title's armatures; muted, every chunk is shown."""
+    for name in state["armatures"]:
+        arm_obj = bpy.data.objects[name]
+        action = arm_obj.animation_data.action if arm_obj.animation_data else None
+        if action is None:
+            continue
+        for fc in action_channels(arm_obj, action).fcurves:
+            if fc.data_path in VISIBILITY_PATHS:
+                fc.mute = mute
+        if mute:
+            arm_obj.hide_viewport = arm_obj.hide_render = False
+
+def sample_title(context, empty):
+    """Evaluates the pose bones of a generated title at every frame of the scene range.
+
+    Each frame is read with one foreach_get per channel and armature. Chunk
+    culling is muted meanwhile, so off-screen chunks are sampled too.
+    Returns samples of shape (frames, letters, 9) in the layout of bake.CHANNELS.
+    """
+    state = read_title_state(empty)
+    collections = [bpy.data.objects[name].pose.bones for name in state["armatures"]]
+    scene = context.scene
+    frames = range(scene.frame_start, scene.frame_end + 1)
+    samples = np.empty((len(frames), sum(map(len, collections)), 9), dtype=np.float32)
+    saved = scene.frame_current
+    mute_culling(state)
+    try:
+        for f, frame in enumerate(frames):
+            scene.frame_set(frame)
+            read_pose_channels(collections, samples[f])
+    finally:
+        mute_culling(state, False)
+        scene.frame_set(saved)
+    return samples[:, title_bone_order(state, collections)]
+
+def spheres_in_view(points, radii, view_frame, orthographic=False):
+    """Tells which spheres, centered on points in camera space, reach into a camera's view.
+
+    view_frame holds the four corners of Camera.view_frame(). The near and
+    far clipping distances are ignored.
+    """
+    corners = np.array(view_frame, dtype=np.float64)
+    if orthographic:
+        lo = corners[:, :2].min(axis=0) - radii[:, None]
+        hi = corners[:, :2].max(axis=0) + radii[:, None]
+        return np.all((points[:, :2] >= lo) & (points[:, :2] <= hi), axis=1) & (points[:, 2] <= radii)
+    # The four side planes of the view pyramid, through the camera and two neighbouring corners
+    normals = np.cross(corners, np.roll(corners, -1, axis=0))
+    normals *= np.sign(normals @ corners.mean(axis=0))[:, None]
+    normals /= np.linalg.norm(normals, axis=1)[:, None]
+    return np.all(points @ normals.T >= -radii[:, None], axis=1)
+
+def cull_title_chunks_steps(context, empty, margin=1):
+    """Keys each chunk of a title hidden in viewports and renders on the frames where none of its letters can be seen.
+
+    A letter counts as seen while it is scaled up (see bake.shown_letters)
+    and, when the scene has a camera, a sphere around it reaches into the
+    camera view. The chunk's armature and letters share the keys, so a
+    hidden chunk is not evaluated at all. Every frame of the scene range is
+    sampled and shown spans are widened by margin frames. The camera and title placement at generation
+    time count; update the title after moving them. Yields the fraction of
+    frames sampled and returns the number of chunk frames hidden.
+    """
+    state = read_title_state(empty)
+    scene = context.scene
+    armatures = [bpy.data.objects[name] for name in state["armatures"]]
+    collections = [arm_obj.pose.bones for arm_obj in armatures]
+    order = title_bone_order(state, collections)
+    letters = [bpy.data.objects[name] for name in state["letters"]]
+    rest = title_rest_matrices(state).astype(np.float64)
+    # Bones sit half the glyph height above its center, so the sphere around the bone
+    # reaches every corner with that much on top of the glyph's half diagonal
+    radii = np.array(state["extents"]) + np.array(state["centers"])
+    camera = scene.camera
+    if camera is not None and (camera.type != 'CAMERA' or camera.data.type == 'PANO'):
+        camera = None
+
+    frames = np.arange(scene.frame_start, scene.frame_end + 1)
+    seen = np.zeros((len(frames), len(order)), dtype=bool)
+    pose = np.empty((sum(map(len, collections)), 9), dtype=np.float32)
+    saved = scene.frame_current
+    # Only the rigs and the camera need evaluating while sampling
+    for letter in letters:
+        letter.hide_viewport = True
+    try:
+        for f, frame in enumerate(frames):
+            scene.frame_set(frame)
+            read_pose_channels(collections, pose)
+            channels = pose[order].astype(np.float64)
+            scale = np.abs(channels[:, 6:9]).max(axis=1)
+            seen[f] = bake.shown_letters(channels)
+            if camera is not None:
+                world = np.array(armatures[0].matrix_world)
+                view = np.array(camera.matrix_world.inverted()) @ world
+                heads = rest[:, :3, 3] + np.einsum("nij,nj->ni", rest[:, :3, :3], channels[:, 0:3])
+                points = heads @ view[:3, :3].T + view[:3, 3]
+                extent = radii * scale * np.linalg.norm(world[:3, :3], axis=0).max()
+                seen[f] &= spheres_in_view(points, extent, camera.data.view_frame(scene=scene), camera.data.type == 'ORTHO')
+            yield (f + 1) / len(frames)
+    finally:
+        for letter in letters:
+            letter.hide_viewport = False
+
+    chunk = state["chunk"]
+    hidden_frames = 0
+    for c, (arm_obj, hidden) in enumerate(zip(armatures, bake.hidden_chunks(seen, chunk, margin).T)):
+        if not hidden.any():
+            continue
+        hidden_frames += int(hidden.sum())
+        key_visibility(arm_obj, frames, hidden)
+        chunk_letters = letters[c * chunk:(c + 1) * chunk]
+        if chunk_letters:
+            # Letters only carry visibility keys, so the chunk's letters can share one action
+            action = key_visibility(chunk_letters[0], frames, hidden)
+            action.name = f"{arm_obj.name}Visibility"
+            for letter in chunk_letters[1:]:
+                assign_action(letter, action)
+    scene.frame_set(saved)
+    return hidden_frames
+
+def export_baked(context, empty, filepath, dtype='FLOAT32', delta=False):
+    """Writes the baked transforms of a generated title to filepath (see bake). Returns the header."""
+    state = read_title_state(empty)
+    samples = sample_title(context, empty)
+    rest = title_rest_matrices(state)
+    glyph_table = list(dict.fromkeys(state["glyphs"]))
+    scene = context.scene
+    header = {
+        "text": state["text"],
+        "fps": scene.render.fps / scene.render.fps_base,
+        "frame_start": scene.frame_start,
+        "frame_end": scene.frame_end,
+        "glyphs": glyph_table,
+        "glyph_index": [glyph_table.index(c) for c in state["glyphs"]],
+        "rest": rest.reshape(len(rest), 16).tolist(),
+    }
+    with open(filepath, "wb") as f:
+        f.write(bake.encode(samples, header, dtype, delta))
+    return header
+
+def render_atlas(context, empty, filepath):
+    """Renders every distinct pose of a generated title once and packs the images into a sprite sheet.
+
+    Poses are found from the sampled pose bones, and rendered images are
+    content-hashed so poses that still look the same share a cell. The atlas
+    is written to filepath as PNG and the frame -> cell table next to it as
+    JSON, cells counted row by row from the top left. Returns the table.
+    """
+    scene = context.scene
+    pose, first = bake.unique_poses(sample_title(context, empty))
+    frames = list(range(scene.frame_start, scene.frame_end + 1))
+    image_settings = scene.render.image_settings
+    saved = (scene.frame_current, scene.render.filepath, image_settings.file_format, image_settings.color_mode)
+    cells, cell_of_pose, digests = [], [], {}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        try:
+            image_settings.file_format = 'PNG'
+            image_settings.color_mode = 'RGBA'
+            for p, f in enumerate(first):
+                scene.frame_set(frames[f])
+                scene.render.filepath = os.path.join(temp_dir, f"pose_{p}.png")
+                bpy.ops.render.render(write_still=True)
+                image = bpy.data.images.load(scene.render.filepath)
+                width, height = image.size
+                pixels = np.empty(width * height * 4, dtype=np.float32)
+                image.pixels.foreach_get(pixels)
+                bpy.data.images.remove(image)
+                digest = hashlib.sha1(np.round(pixels * 255).astype(np.uint8).tobytes()).hexdigest()
+                if digest not in digests:
+                    digests[digest] = len(cells)
+                    # Blender stores images bottom row first
+                    cells.append(pixels.reshape(height, width, 4)[::-1])
+                cell_of_pose.append(digests[digest])
+        finally:
+            scene.frame_set(saved[0])
+            scene.render.filepath, image_settings.file_format, image_settings.color_mode = saved[1:]
+
+    height, width = cells[0].shape[:2] if cells else (0, 0)
+    columns = ceil(sqrt(len(cells)))
+    rows = ceil(len(cells) / columns) if columns else 0
+    atlas = np.zeros((rows * height, columns * width, 4), dtype=np.float32)
+    for k, cell in enumerate(cells):
+        row, column = divmod(k, columns)
+        atlas[row * height:(row + 1) * height, column * width:(column + 1) * width] = cell
+    if cells:
+        image = bpy.data.images.new(os.path.basename(filepath), columns * width, rows * height, alpha=True)
+        image.pixels.foreach_set(atlas[::-1].ravel())
+        image.filepath_raw = filepath
+        image.file_format = 'PNG'
+        image.save()
+        bpy.data.images.remove(image)
+
+    table = {
+        "image": os.path.basename(filepath),
+        "fps": scene.render.fps / scene.render.fps_base,
+        "frame_start": scene.frame_start,
+        "frame_end": scene.frame_end,
+        "cell_width": width,
+        "cell_height": height,
+        "columns": columns,
+        "rows": rows,
+        "rendered": len(first),
+        "cells": len(cells),
+        "frames": [cell_of_pose[p] for p in pose.tolist()],
+    }
+    with open(os.path.splitext(filepath)[0] + ".json", "w", encoding="utf-8") as f:
+        json.dump(table, f, indent=1)
+    return table
+
+def render_sequence(context, empty):
+    """Renders the scene range to the output path like Render Animation, skipping frames where the title holds still.
+
+    Only the first frame of each run of frames with an identical pose is
+    rendered; the other frames of the run are hardlinked to its file, or
+    copied where links aren't possible, so the result is a normal numbered
+    sequence. Only the title's bones are compared, so other animation in the
+    scene (a moving camera, say) needs a regular render. Returns the number
+    of (rendered, linked) frames.
+    """
+    scene = context.scene
+    if scene.render.is_movie_format:
+        raise ValueError("Static frames can only be linked in image sequences, not movie files")
+    runs = bake.pose_runs(bake.unique_poses(sample_title(context, empty))[0])
+    saved = scene.frame_current
+    saved_path = scene.render.filepath
+    # All numbered paths are taken from the output pattern before it is swapped out below
+    paths = [scene.render.frame_path(frame=frame) for frame in range(scene.frame_start, scene.frame_end + 1)]
+    rendered = linked = 0
+    try:
+        for first, last in runs:
+            frame = scene.frame_start + first
+            scene.frame_set(frame)
+            # write_still saves to the output path as it is, without a frame number
+            source = scene.render.filepath = paths[first]
+            bpy.ops.render.render(write_still=True)
+            rendered += 1
+            for other in range(first + 1, last + 1):
+                target = paths[other]
+                if os.path.lexists(target):
+                    os.remove(target)
+                try:
+                    os.link(source, target)
+                except OSError:
+                    shutil.copyfile(source, target)
+                linked += 1
+    finally:
+        scene.render.filepath = saved_path
+        scene.frame_set(saved)
+    return rendered, linked
+
+def write_profile(profiler, name="TextAnim_Profile", limit=40):
+    """Writes the slowest calls of profiler, by cumulative time, into the text block name."""
+    out = io.StringIO()
+    pstats.Stats(profiler, stream=out).sort_stats('cumulative').print_stats(limit)
+    text = bpy.data.texts.get(name) or bpy.data.texts.new(name)
+    text.from_string(out.getvalue())
+    return text
+
+def title_options(context):
+    """Returns the generate_title() keyword arguments set in the panel, besides the font and the stats."""
+    scene = context.scene
+    update = None
+    if scene.text_anim_update and read_title_state(context.active_object) is not None:
+        update = context.active_object
+    cache = ActionCache(scene.text_anim_cache_dir, scene.text_anim_cache_size * 2**20) if scene.text_anim_cache_dir else None
+    return dict(anim_type=scene.text_anim_type, extra_spacing=scene.text_anim_spacing, geometry=scene.text_anim_geometry,
+                apply_decimate=scene.text_anim_apply_decimate, update=update, seed=scene.text_anim_seed, cache=cache,
+                key_tolerance=scene.text_anim_key_tolerance, chunk_size=scene.text_anim_chunk_size)
+
+def finish_title(operator, context, empty, stats):
+    """Makes the new title the active object and reports on its generation."""
+    scene = context.scene
+    bpy.ops.object.select_all(action='DESELECT')
+    empty.select_set(True)
+    context.view_layer.objects.active = empty
+    operator.report({'INFO'}, f"Created animated text: {scene.text_anim_input.upper()} with {scene.text_anim_type} animation")
+    operator.report({'INFO'}, f"Generation: {stats.summary()}")
+    removed = stats.counts.get("keys removed", 0)
+    if removed:
+        total = removed + stats.counts["keyframes"]
+        operator.report({'INFO'}, f"Key reduction: {removed} of {total} keys removed ({100.0 * removed / total:.1f}%)")
+
+class TEXT_ANIM_OT_run(Operator):
+    bl_idname = "object.text_anim_run"
+    bl_label = "Create Animated Text"
+    bl_description = "Creates rigged 3D text with per-letter appear animation"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        scene = context.scene
+        try:
+            font = load_font(scene.text_anim_font)
+        except ValueError as exc:
+            self.report({'ERROR'}, str(exc))
+            return {'CANCELLED'}
+
+        stats = GenerationStats()
+        profiler = cProfile.Profile() if scene.text_anim_profile else None
+        if profiler is not None:
+            profiler.enable()
+        try:
+            empty = generate_title(context, scene.text_anim_input, font, stats=stats, **title_options(context))
+        finally:
+            if profiler is not None:
+                profiler.disable()
+
+        finish_title(self, context, empty, stats)
+        if profiler is not None:
+            text = write_profile(profiler)
+            self.report({'INFO'}, f"Profile written to text block {text.name}")
+        return {'FINISHED'}
+
+ROLLBACK_DATA = ("objects", "meshes", "curves", "armatures", "actions", "materials")
+
+class TEXT_ANIM_OT_run_steps(Operator):
+    """Generates a title a few pieces at a time between redraws, with progress in the status bar.
+
+    Every timer tick runs generation steps until STEP_BUDGET seconds are
+    used, so the number of letters or F-curves handled per tick follows the
+    speed of the machine. Esc stops the generation and removes every
+    datablock it added. Updating a title in place changes it from the first
+    step on and can't be undone that way, so updates run in one go.
+    """
+    bl_idname = "object.text_anim_run_steps"
+    bl_label = "Create in Background"
+    bl_description = "Creates the animated text step by step while the interface stays responsive. Esc cancels"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def invoke(self, context, event):
+        scene = context.scene
+        try:
+            font = load_font(scene.text_anim_font)
+        except ValueError as exc:
+            self.report({'ERROR'}, str(exc))
+            return {'CANCELLED'}
+
+        options = title_options(context)
+        self._stats = GenerationStats()
+        if options["update"] is not None:
+            empty = generate_title(context, scene.text_anim_input, font, stats=self._stats, **options)
+            finish_title(self, context, empty, self._stats)
+            return {'FINISHED'}
+
+        self._before = {name: set(getattr(bpy.data, name)) for name in ROLLBACK_DATA}
+        self._scene_settings = (scene.render.fps, scene.render.fps_base, scene.frame_end, scene.frame_current)
+        # bpy.context rather than context: the steps run in later modal calls
+        self._steps = generate_title_steps(bpy.context, scene.text_anim_input, font, stats=self._stats, **options)
+        self._stats.pause()
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(0.001, window=context.window)
+        wm.progress_begin(0, 100)
+        wm.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        if event.type == 'ESC':
+            self.rollback(context)
+            self.report({'WARNING'}, "Title generation cancelled")
+            return {'CANCELLED'}
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+
+        deadline = time.perf_counter() + STEP_BUDGET
+        self._stats.resume()
+        try:
+            while True:
+                progress = next(self._steps)
+                if time.perf_counter() >= deadline:
+                    break
+        except StopIteration as finished:
+            self.stop(context)
+            finish_title(self, context, finished.value, self._stats)
+            return {'FINISHED'}
+        except Exception as exc:
+            self.rollback(context)
+            self.report({'ERROR'}, f"Title generation failed: {exc}")
+            return {'CANCELLED'}
+        self._stats.pause()
+
+        context.window_manager.progress_update(int(progress * 100))
+        context.workspace.status_text_set(f"Generating title: {progress:.0%} (Esc to cancel)")
+        return {'RUNNING_MODAL'}
+
+    def stop(self, context):
+        wm = context.window_manager
+        wm.event_timer_remove(self._timer)
+        wm.progress_end()
+        context.workspace.status_text_set(None)
+
+    def rollback(self, context):
+        """Closes the generation and removes the datablocks it added, keeping cached glyph meshes."""
+        self.stop(context)
+        self._steps.close()
+        if context.object is not None and context.object.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
+        added = [block for name in ROLLBACK_DATA for block in getattr(bpy.data, name)
+                 if block not in self._before[name] and "text_anim_lod" not in block]
+        bpy.data.batch_remove(added)
+        scene = context.scene
+        scene.render.fps, scene.render.fps_base, scene.frame_end, scene.frame_current = self._scene_settings
+
+class TEXT_ANIM_OT_export(Operator, ExportHelper):
+    bl_idname = "object.text_anim_export"
+    bl_label = "Export Baked Animation"
+    bl_description = "Bakes the per-letter transforms of the selected title into a packed binary file for game runtimes"
+    filename_ext = ".gota"
+    filter_glob: bpy.props.StringProperty(default="*.gota", options={'HIDDEN'})
+    precision: bpy.props.EnumProperty(
+        name="Precision",
+        items=[
+            ('FLOAT32', "Float 32", "Full precision"),
+            ('FLOAT16', "Float 16", "Half the size, about 3 significant digits"),
+            ('INT16', "Quantized 16-bit", "Each component quantized over its own range"),
+        ],
+        default='FLOAT32'
+    )
+    delta: bpy.props.BoolProperty(name="Delta Encoding", description="Store quantized frames as differences to the previous frame, which compresses better", default=False)
+
+    @classmethod
+    def poll(cls, context):
+        return read_title_state(context.active_object) is not None
+
+    def draw(self, context):
+        self.layout.prop(self, "precision")
+        row = self.layout.row()
+        row.active = self.precision == 'INT16'
+        row.prop(self, "delta")
+
+    def execute(self, context):
+        header = export_baked(context, context.active_object, self.filepath, self.precision,
+                              self.delta and self.precision == 'INT16')
+        self.report({'INFO'}, f"Exported {header['frame_end'] - header['frame_start'] + 1} frames of {len(header['glyph_index'])} letters to {self.filepath}")
+        return {'FINISHED'}
+
+class TEXT_ANIM_OT_render_atlas(Operator, ExportHelper):
+    bl_idname = "object.text_anim_render_atlas"
+    bl_label = "Render Sprite Sheet"
+    bl_description = "Renders each distinct pose of the selected title once and packs them into a texture atlas with a frame to cell table"
+    filename_ext = ".png"
+    filter_glob: bpy.props.StringProperty(default="*.png", options={'HIDDEN'})
+
+    @classmethod
+    def poll(cls, context):
+        return read_title_state(context.active_object) is not None
+
+    def execute(self, context):
+        table = render_atlas(context, context.active_object, self.filepath)
+        self.report({'INFO'}, f"Rendered {table['rendered']} poses for {len(table['frames'])} frames into {table['cells']} cells of {self.filepath}")
+        return {'FINISHED'}
+
+class TEXT_ANIM_OT_render_sequence(Operator):
+    bl_idname = "object.text_anim_render_sequence"
+    bl_label = "Render Sequence"
+    bl_description = "Renders the animation of the selected title to the output path, rendering each still pose once and linking its file for the frames that repeat it"
+
+    @classmethod
+    def poll(cls, context):
+        return read_title_state(context.active_object) is not None
+
+    def execute(self, context):
+        try:
+            rendered, linked = render_sequence(context, context.active_object)
+        except ValueError as exc:
+            self.report({'ERROR'}, str(exc))
+            return {'CANCELLED'}
+        self.report({'INFO'}, f"Rendered {rendered} frames, linked {linked} static frames")
+        return {'FINISHED'}
+
+class TEXT_ANIM_PT_panel(Panel):
+    bl_label = "Game Over Text Animator"
+    bl_idname = "TEXT_ANIM_PT_panel"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = "Text Animator"
+    bl_context = "objectmode"
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(context.scene, "text_anim_input", text="Text")
+        layout.prop(context.scene, "text_anim_font", text="Font File")
+        layout.prop(context.scene, "text_anim_spacing", text="Spacing")
+        layout.prop(context.scene, "text_anim_type", text="Animation Type")
+        row = layout.row()
+        row.active = context.scene.text_anim_type in RANDOM_ANIMATION_TYPES
+        row.prop(context.scene, "text_anim_seed", text="Seed")
+        layout.prop(context.scene, "text_anim_geometry", text="Geometry")
+        row = layout.row()
+        row.active = context.scene.text_anim_geometry == 'UNIQUE'
+        row.prop(context.scene, "text_anim_apply_decimate", text="Apply Decimate")
+        row = layout.row()
+        row.active = context.scene.text_anim_geometry != 'MERGED'
+        row.prop(context.scene, "text_anim_chunk_size", text="Letters per Armature")
+        layout.prop(context.scene, "text_anim_key_tolerance", text="Key Reduction")
+        layout.prop(context.scene, "text_anim_update", text="Update Selected Title")
+        layout.prop(context.scene, "text_anim_profile", text="Profile Generation")
+        layout.prop(context.scene, "text_anim_cache_dir", text="Action Cache")
+        row = layout.row()
+        row.active = bool(context.scene.text_anim_cache_dir)
+        row.prop(context.scene, "text_anim_cache_size", text="Cache Size (MB)")
+        row = layout.row(align=True)
+        row.operator("object.text_anim_run", text="Run Animation", icon='PLAY')
+        row.operator("object.text_anim_run_steps", text="", icon='TIME')
+        layout.operator("object.text_anim_export", icon='EXPORT')
+        layout.operator("object.text_anim_render_sequence", icon='RENDER_ANIMATION')
+        layout.operator("object.text_anim_render_atlas", icon='IMGDISPLAY')
+
+ANIMATION_TYPES = [
+    ('DAYTONA', "Daytona USA-like", "Shuffle and Snap"),
+    ('CIRCULAR_APPROACH', "Circular Approach", ""),
+    ('BAD_GAME_OVER', "Bad Game Over", ""),
+    ('GOOD_GAME_OVER', "Good Game Over", ""),
+    ('ELASTIC_WAVE', "Elastic Wave", ""),
+    ('3D_TUMBLE', "3D Tumble", ""),
+    ('DIGITAL_GLITCH', "Digital Glitch", "Phase 1: Fall, Phase 2: Glitch"),
+    ('SLINGSHOT_SNAP', "Slingshot Snap", "Phase 1: Tension, Phase 2: Release"),
+    ('ARCADE_SLAM', "Arcade Slam", "Phase 1: Meteor, Phase 2: Impact, Phase 3: Pulse")
+]
+
+# Presets with random variation, driven by text_anim_seed
+RANDOM_ANIMATION_TYPES = {'DIGITAL_GLITCH', 'SLINGSHOT_SNAP', 'ARCADE_SLAM'}
+
+def register_properties():
+    bpy.types.Scene.text_anim_input = bpy.props.StringProperty(name="Text", description="Text to animate", default="GAME OVER!")
+    bpy.types.Scene.text_anim_font = bpy.props.StringProperty(name="Font File", description="Path to font file", subtype='FILE_PATH', default="")
+    bpy.types.Scene.text_anim_spacing = bpy.props.FloatProperty(name="Spacing", description="Extra spacing", default=0.0, min=0.0)
+    bpy.types.Scene.text_anim_type = bpy.props.EnumProperty(
+        items=ANIMATION_TYPES,
+        name="Animation Type",
+        default='DAYTONA'
+    )
+    bpy.types.Scene.text_anim_seed = bpy.props.IntProperty(name="Seed", description="Random variation of the glitch, slingshot and slam presets; the same seed always gives the same animation", default=0, min=0)
+    bpy.types.Scene.text_anim_geometry = bpy.props.EnumProperty(
+        items=[
+            ('UNIQUE', "Per Letter", "Every letter owns its mesh, deformed by the armature"),
+            ('INSTANCED', "Instanced", "Letters share one decimated mesh per distinct glyph and follow their bone"),
+            ('MERGED', "Merged", "All letters in one decimated mesh with a vertex group per letter, deformed by one Armature modifier")
+        ],
+        name="Geometry",
+        default='UNIQUE'
+    )
+    bpy.types.Scene.text_anim_update = bpy.props.BoolProperty(name="Update Selected Title", description="When the active object is a generated title group, change it in place and only rebuild the letters whose glyph changed", default=False)
+    bpy.types.Scene.text_anim_chunk_size = bpy.props.IntProperty(name="Letters per Armature", description="Split the rig into armatures of at most this many bones, each hidden on the frames where none of its letters is scaled up inside the camera view; 0 keeps one armature", default=0, min=0, soft_max=256)
+    bpy.types.Scene.text_anim_key_tolerance = bpy.props.FloatProperty(name="Key Reduction", description="Leave out sampled keys as long as the animation stays within this distance (or angle in radians) of them; 0 keeps every key", default=0.0, min=0.0, soft_max=0.1, precision=4, step=0.1)
+    bpy.types.Scene.text_anim_profile = bpy.props.BoolProperty(name="Profile Generation", description="Run the generation under cProfile and write the slowest calls to the TextAnim_Profile text block", default=False)
+    bpy.types.Scene.text_anim_cache_dir = bpy.props.StringProperty(name="Action Cache", description="Directory where generated actions are kept and reused for the same preset, letter count and seed; empty disables the cache", subtype='DIR_PATH', default="")
+    bpy.types.Scene.text_anim_cache_size = bpy.props.IntProperty(name="Cache Size", description="Size limit of the action cache in megabytes; the least recently used actions are deleted beyond it", default=256, min=1)
+    bpy.types.Scene.text_anim_apply_decimate = bpy.props.BoolProperty(name="Apply Decimate", description="Decimate each glyph once at generation time (reusing cached glyphs) instead of keeping a live Decimate modifier on every letter", default=False)
+
+def unregister_properties():
+    del bpy.types.Scene.text_anim_input
+    del bpy.types.Scene.text_anim_font
+    del bpy.types.Scene.text_anim_spacing
+    del bpy.types.Scene.text_anim_type
+    del bpy.types.Scene.text_anim_seed
+    del bpy.types.Scene.text_anim_geometry
+    del bpy.types.Scene.text_anim_apply_decimate
+    del bpy.types.Scene.text_anim_update
+    del bpy.types.Scene.text_anim_profile
+    del bpy.types.Scene.text_anim_key_tolerance
+    del bpy.types.Scene.text_anim_chunk_size
+    del bpy.types.Scene.text_anim_cache_dir
+    del bpy.types.Scene.text_anim_cache_size
+
+classes = (TEXT_ANIM_OT_run, TEXT_ANIM_OT_run_steps, TEXT_ANIM_OT_export, TEXT_ANIM_OT_render_atlas,
+           TEXT_ANIM_OT_render_sequence, TEXT_ANIM_PT_panel)
+def register():
+    register_properties()
+    for cls in classes: bpy.utils.register_class(cls)
+def unregister():
+    for cls in reversed(classes): bpy.utils.unregister_class(cls)
+    unregister_properties()
+    clear_glyph_metrics()
+if __name__ == "__main__": register()
\ No newline at end of file
@@ -0,0 +1,138 @@
+"""Baked per-letter transforms in a packed binary file, independent of Blender.
+
+Game runtimes play these instead of an armature. The layout, little-endian:
+
+    offset 0   b"GOTA"
+    offset 4   uint32 format version
+    offset 8   uint32 length of the JSON header in bytes
+    offset 12  JSON header, padded with spaces so the samples start at a
+               multiple of 16 bytes
+    then       samples, frames x letters x 9 values: location xyz,
+               rotation_euler xyz (radians, XYZ order) and scale xyz of the
+               letter's bone, in bone space
+
+The header holds the sample "dtype" (float32, float16 or quantized int16),
+the "shape", the frame range and "fps", the glyph table with each letter's
+index into it, and each letter's bone rest matrix ("rest", row-major 4x4 in
+armature space). A letter's vertices, given in armature space, move by
+rest @ T(location) @ R(rotation) @ S(scale) @ inverse(rest).
+
+Quantized samples decode as (q + 32768) * step + offset per component. With
+delta encoding every frame after the first holds the difference to the
+previous frame, wrapping around in 16 bits. decode() is the reference
+reader.
+
+The same samples tell which frames show an identical pose, so renders can
+skip them, and which letters are too small to be seen; see unique_poses(),
+pose_runs(), shown_letters() and hidden_chunks().
+"""
+
+import json
+import struct
+
+import numpy as np
+
+MAGIC = b"GOTA"
+VERSION = 1
+CHANNELS = ("location", "rotation_euler", "scale")
+DTYPES = {'FLOAT32': '<f4', 'FLOAT16': '<f2', 'INT16': '<i2'}
+# Presets park letters that have not appeared yet at scale 0.001
+SHOWN_SCALE = 0.01
+
+def encode(samples, header, dtype='FLOAT32', delta=False):
+    """Packs samples of shape (frames, letters, 9) with header (a dict) into bytes.
+
+    dtype is one of DTYPES. delta encoding needs INT16, since with floats the
+    rounding errors would add up over the frames.
+    """
+    if dtype not in DTYPES:
+        raise ValueError(f"Unknown sample type {dtype!r}")
+    if delta and dtype != 'INT16':
+        raise ValueError("Delta encoding needs quantized INT16 samples")
+    samples = np.asarray(samples, dtype=np.float64)
+    header = dict(header, version=VERSION, channels=list(CHANNELS), shape=list(samples.shape),
+                  dtype=dtype, delta=delta)
+
+    if dtype == 'INT16':
+        lo = samples.min(axis=(0, 1)) if samples.size else np.zeros(samples.shape[-1])
+        hi = samples.max(axis=(0, 1)) if samples.size else np.zeros(samples.shape[-1])
+        step = np.where(hi > lo, (hi - lo) / 65535.0, 1.0)
+        data = (np.round((samples - lo) / step) - 32768).astype(np.int16)
+        header["offset"] = lo.tolist()
+        header["step"] = step.tolist()
+        if delta:
+            wrapped = data.view(np.uint16)
+            wrapped[1:] = wrapped[1:] - wrapped[:-1].copy()
+    else:
+        data = samples.astype(DTYPES[dtype])
+
+    body = json.dumps(header, separators=(",", ":")).encode("utf-8")
+    body += b" " * (-(12 + len(body)) % 16)
+    return MAGIC + struct.pack("<II", VERSION, len(body)) + body + data.astype(DTYPES[dtype]).tobytes()
+
+def decode(buffer):
+    """Returns (header, samples) of a packed file as float32 samples of shape (frames, letters, 9)."""
+    buffer = memoryview(buffer)
+    if bytes(buffer[:4]) != MAGIC:
+        raise ValueError("Not a baked text animation")
+    version, length = struct.unpack_from("<II", buffer, 4)
+    if version > VERSION:
+        raise ValueError(f"Unsupported format version {version}")
+    header = json.loads(bytes(buffer[12:12 + length]))
+    data = np.frombuffer(buffer, dtype=DTYPES[header["dtype"]], offset=12 + length).reshape(header["shape"])
+    if header["dtype"] != 'INT16':
+        return header, data.astype(np.float32)
+    if header["delta"]:
+        data = np.cumsum(data.view(np.uint16), axis=0, dtype=np.uint16).view(np.int16)
+    samples = (data.astype(np.float64) + 32768) * np.array(header["step"]) + np.array(header["offset"])
+    return header, samples.astype(np.float32)
+
+def unique_poses(samples, tolerance=1e-5):
+    """Groups the frames of samples (frames, letters, 9) by the pose they show.
+
+    Returns (pose, first): pose[f] numbers the pose of frame f, in order of
+    first appearance, and first[p] is the first frame showing pose p. Values
+    are compared after rounding to multiples of tolerance.
+    """
+    samples = np.asarray(samples, dtype=np.float64)
+    if not len(samples):
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    keys = np.round(samples.reshape(len(samples), -1) / tolerance).astype(np.int64)
+    _, first, inverse = np.unique(keys, axis=0, return_index=True, return_inverse=True)
+    # np.unique sorts the poses; number them by first appearance instead
+    order = np.argsort(first)
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    return rank[inverse.ravel()], first[order]
+
+def pose_runs(pose):
+    """Splits frames into runs of consecutive frames showing the same pose.
+
+    pose is the per-frame pose numbering of unique_poses(). Returns a list
+    of (first, last) frame index pairs, last inclusive.
+    """
+    pose = np.asarray(pose)
+    if not len(pose):
+        return []
+    starts = np.flatnonzero(np.concatenate(([True], pose[1:] != pose[:-1])))
+    ends = np.concatenate((starts[1:] - 1, [len(pose) - 1]))
+    return list(zip(starts.tolist(), ends.tolist()))
+
+def shown_letters(samples):
+    """Tells, for samples of shape (..., 9), whether each letter is scaled above SHOWN_SCALE."""
+    return np.abs(np.asarray(samples)[..., 6:9]).max(axis=-1) > SHOWN_SCALE
+
+def hidden_chunks(shown, chunk, margin=1):
+    """Finds the frames where no letter of a chunk is shown.
+
+    shown is of shape (frames, letters), as from shown_letters(); letters
+    are split into chunks of chunk consecutive letters. Shown spans are
+    widened by margin frames. Returns a mask of shape (frames, chunks).
+    """
+    shown = np.asarray(shown, dtype=bool)
+    chunks = -(-shown.shape[1] // chunk)
+    hidden = np.empty((len(shown), chunks), dtype=bool)
+    for c in range(chunks):
+        any_shown = shown[:, c * chunk:(c + 1) * chunk].any(axis=1)
+        hidden[:, c] = np.convolve(any_shown, np.ones(2 * margin + 1), mode="same") == 0
+    return hidden
@@ -0,0 +1,456 @@
+"""Preset motion for the Game Over Text Animator, independent of Blender.
+
+Every preset is a function taking the letter count (plus the letter positions
+and a NumPy random generator, for presets that want them) and returning a
+Motion: the keyframes of all letters for every animated pose bone channel, as
+flat NumPy arrays built with one vectorized call per key block. The add-on
+only writes the result into F-curves, so this module imports nothing from
+Blender and can be tested and profiled with a plain Python interpreter:
+
+    import sys; sys.path.insert(0, "game_over_text_animator")
+    import presets
+    motion = presets.evaluate('DAYTONA', 500)
+
+The random presets draw all of their jitter for all letters in one call on a
+generator seeded per title, so the same seed always gives the same motion,
+on any machine.
+"""
+
+import inspect
+from math import pi
+
+import numpy as np
+
+class Motion:
+    """Keyframes of every letter for one preset, kept per channel as flat arrays.
+
+    A channel is a (data_path, array index) pair of a pose bone, e.g.
+    ("location", 2). key() adds a block of keys for all letters at once, and
+    stagger() copies the keys of a one-letter template to every letter with
+    a time offset. Blocks keep the order they were added in, so, like
+    keyframe_insert, a later key on the same frame of the same letter and
+    channel replaces the earlier one when the motion is written. That is how
+    presets vary letters: they stagger a template, then key what differs per
+    letter on top of it.
+    """
+
+    def __init__(self, num_letters):
+        self.num_letters = num_letters
+        self._blocks = {}
+
+    @property
+    def frame_end(self):
+        """The last keyed frame, or 1 without keys."""
+        frames = [block[1] for blocks in self._blocks.values() for block in blocks]
+        return _last_frame(np.concatenate(frames)) if frames else 1
+
+    def key(self, data_path, index, frames, values, phase=None, mask=None):
+        """Keys one channel for every letter.
+
+        frames and values are scalars, per-letter arrays of shape (num_letters,),
+        or arrays of shape (num_letters, k) / (1, k) giving each letter k keys.
+        mask, shaped like the broadcast keys, drops the keys where it is False.
+        phase tags the keys for the interpolation rules of the add-on.
+        """
+        n = self.num_letters
+        frames, values, _ = np.broadcast_arrays(_per_letter(frames), _per_letter(values), np.empty((n, 1)))
+        letters = np.broadcast_to(np.arange(n)[:, None], frames.shape)
+        if mask is not None:
+            mask = np.broadcast_to(mask, frames.shape)
+            letters, frames, values = letters[mask], frames[mask], values[mask]
+        self._blocks.setdefault((data_path, index), []).append(
+            (letters.ravel(), frames.ravel(), values.ravel(), phase))
+
+    def stagger(self, template, offsets):
+        """Gives every letter the keys of template, a one-letter Motion, shifted by offsets[letter] frames.
+
+        The template's arrays are only copied, so the cost per letter doesn't
+        depend on how the template was computed.
+        """
+        n = self.num_letters
+        offsets = np.broadcast_to(np.asarray(offsets, dtype=float), (n,))
+        letters = np.arange(n)
+        for channel, blocks in template._blocks.items():
+            for _letters, frames, values, phase in blocks:
+                self._blocks.setdefault(channel, []).append((
+                    np.repeat(letters, len(frames)),
+                    (offsets[:, None] + frames[None, :]).ravel(),
+                    np.tile(values, n),
+                    phase))
+
+    def key_vector(self, data_path, frames, values, phase=None, mask=None):
+        """Keys all three channels of data_path; values has a trailing axis of 3."""
+        values = np.asarray(values, dtype=float)
+        for i in range(3):
+            self.key(data_path, i, frames, values[..., i], phase, mask)
+
+    def channels(self):
+        """Returns {(data_path, index): (letters, frames, values, phases)}, sorted by letter.
+
+        Channels are in the order they were first keyed, and the keys of each
+        letter keep the order they were added in.
+        """
+        result = {}
+        for channel, blocks in self._blocks.items():
+            letters = np.concatenate([block[0] for block in blocks])
+            frames = np.concatenate([block[1] for block in blocks])
+            values = np.concatenate([block[2] for block in blocks])
+            phases = np.concatenate([np.full(len(block[0]), block[3], dtype=object) for block in blocks])
+            order = np.argsort(letters, kind='stable')
+            result[channel] = (letters[order], frames[order], values[order], phases[order])
+        return result
+
+def _per_letter(a):
+    a = np.asarray(a, dtype=float)
+    if a.ndim == 0:
+        return a.reshape(1, 1)
+    if a.ndim == 1:
+        return a[:, None]
+    return a
+
+def _generator(rng):
+    return np.random.default_rng(0) if rng is None else rng
+
+def _scale(u, low, high):
+    """Maps uniform [0, 1) samples u onto [low, high)."""
+    return low + u * (high - low)
+
+def _last_frame(frames):
+    frames = np.asarray(frames)
+    return int(max(1, frames.max())) if frames.size else 1
+
+def daytona(num_letters, positions=None, rng=None, *, appear_dur=10, shuffle_dur=40,
+            hold_dur=60, transition_dur=8, num_snaps=4):
+    idx = np.arange(num_letters)
+    appear_start_base = 1
+    shuffle_start_base = appear_start_base + 5
+    rotation_start_base = shuffle_start_base + 20
+
+    appear = Motion(1)
+    appear.key_vector("scale", 0, (0.001, 0.001, 0.001))
+    appear.key_vector("scale", appear_dur * 0.6, (1.2, 1.2, 1.2))
+    appear.key_vector("scale", appear_dur, (1, 1, 1))
+    num_shuffles = 6
+    s = np.arange(num_shuffles)
+    direction = np.where(s % 2 == 0, 1, -1)
+    mag = 0.3 * (1 - s / num_shuffles)
+    frames = (appear_dur + s * (shuffle_dur / num_shuffles))[None, :]
+    appear.key("location", 0, frames, (direction * mag)[None, :])
+    appear.key("location", 2, frames, (np.abs(mag) * 0.5)[None, :])
+    appear.key_vector("location", appear_dur + shuffle_dur, (0, 0, 0))
+
+    # Rotation snaps: each 90 degree transition is followed by a hold
+    snaps = Motion(1)
+    snaps.key("rotation_euler", 2, 0, 0.0, phase='hold')
+    frame = hold_dur
+    snaps.key("rotation_euler", 2, frame, 0.0, phase='snap')
+    for i in range(num_snaps):
+        trans_end = frame + transition_dur
+        angle = np.radians(90.0 * (i + 1))
+        snaps.key("rotation_euler", 2, trans_end, angle, phase='hold')
+        frame = trans_end + hold_dur
+        snaps.key("rotation_euler", 2, frame, angle, phase='snap')
+
+    m = Motion(num_letters)
+    m.stagger(appear, appear_start_base + idx * 4)
+    m.stagger(snaps, rotation_start_base + idx * 12)
+    return m
+
+def circular_approach(num_letters, positions=None, rng=None, *, approach_dur=120, circle_radius=2.0,
+                      num_circles=2, self_rot_speed=360, zig_zag_amp=1.0, zig_zag_freq=4,
+                      spin_jump_dur=30, spin_jump_delay=5, spin_jump_height=1.0):
+    idx = np.arange(num_letters)
+    appear_start_base = 1
+    approach_end_base = appear_start_base + (num_letters - 1) * (approach_dur // 2) + approach_dur
+
+    approach = Motion(1)
+    approach.key_vector("scale", -1, (0.001, 0.001, 0.001))
+    approach.key_vector("scale", 0, (1, 1, 1))
+    approach.key("rotation_euler", 2, -1, 0.0)
+    approach.key("rotation_euler", 2, 0, 0.0)
+    # Spiral in from below while spinning
+    num_steps = 40
+    start_y = -20.0
+    t = np.arange(num_steps + 1) / num_steps
+    frames = np.trunc(t * approach_dur)[None, :]
+    y = start_y + t * (0 - start_y) + zig_zag_amp * np.sin(t * 2 * pi * zig_zag_freq) * (1 - t)
+    angle = t * 2 * pi * num_circles
+    spiral = np.stack([circle_radius * np.sin(angle) * (1 - t), y, circle_radius * np.cos(angle) * (1 - t)], axis=-1)
+    approach.key_vector("location", frames, spiral[None, :, :])
+    approach.key("rotation_euler", 2, frames, np.radians(t * self_rot_speed)[None, :])
+    approach.key_vector("location", approach_dur, (0, 0, 0))
+    final_rot = np.radians(self_rot_speed % 360)
+    approach.key("rotation_euler", 2, approach_dur, final_rot)
+
+    # Spinning jump once every letter has arrived
+    jump = Motion(1)
+    jump.key_vector("scale", 0, (1.2, 1.2, 0.8))
+    mid_jump = spin_jump_dur // 2
+    jump.key("location", 2, mid_jump, spin_jump_height)
+    jump.key("rotation_euler", 2, mid_jump, final_rot + np.radians(360))
+    jump.key_vector("scale", mid_jump, (0.8, 0.8, 1.2))
+    jump.key("location", 2, spin_jump_dur, 0.0)
+    jump.key_vector("scale", spin_jump_dur, (1.2, 1.2, 0.8))
+    jump.key_vector("scale", spin_jump_dur + 5, (1, 1, 1))
+
+    m = Motion(num_letters)
+    m.stagger(approach, appear_start_base + idx * (approach_dur // 2))
+    m.stagger(jump, approach_end_base + idx * spin_jump_delay)
+    return m
+
+def bad_game_over(num_letters, positions=None, rng=None, *, interval=15, drop_dur=30, bounce_dur=15,
+                  fall_dur=20, free_fall_dur=30, drop_height=5.0):
+    idx = np.arange(num_letters)
+    appear_start_base = 1
+    fall_start_base = appear_start_base + num_letters * interval + drop_dur + bounce_dur + 20
+
+    # Phase 1: Drop and Bounce
+    drop = Motion(1)
+    drop.key("location", 2, 0, drop_height)
+    drop.key_vector("scale", 0, (1, 1, 1))
+    drop.key_vector("rotation_euler", 0, (0, 0, 0))
+    land = drop_dur
+    drop.key("location", 2, land, 0.0, phase='bounce')
+    drop.key_vector("scale", land, (1.2, 1.2, 0.8), phase='bounce')
+    bounce_peak = land + bounce_dur // 2
+    drop.key("location", 2, bounce_peak, 0.5, phase='bounce')
+    drop.key_vector("scale", bounce_peak, (0.8, 0.8, 1.2), phase='bounce')
+    drop.key("location", 2, land + bounce_dur, 0.0)
+    drop.key_vector("scale", land + bounce_dur, (1, 1, 1))
+
+    # Phase 2: Flat Flip, face down, then Phase 3: Free Fall out of the scene
+    fall = Motion(1)
+    fall.key_vector("rotation_euler", 0, (0, 0, 0))
+    fall.key("location", 2, 0, 0.0)
+    fall.key_vector("rotation_euler", fall_dur, (np.radians(180), 0, 0))
+    fall.key_vector("scale", fall_dur, (1.1, 1.1, 0.9))
+    fall.key("location", 2, fall_dur, 0.0)
+    fall.key("location", 2, fall_dur + free_fall_dur, -10.0)
+    fall.key_vector("scale", fall_dur + free_fall_dur, (1.0, 1.0, 1.0))
+
+    m = Motion(num_letters)
+    m.stagger(drop, appear_start_base + idx * interval)
+    m.stagger(fall, fall_start_base + idx * 5)
+    return m
+
+def good_game_over(num_letters, positions=None, rng=None, *, interval=15, rise_dur=60, spiral_dur=60,
+                   dance_dur=30, delay_between_dances=30):
+    idx = np.arange(num_letters)
+    appear_start_base = 1
+    assemble_base = appear_start_base + num_letters * interval + rise_dur + spiral_dur + 20
+
+    rise = Motion(1)
+    rise.key("location", 2, 0, -5.0)
+    rise.key_vector("scale", 0, (0.5, 0.5, 0.5))
+    rise.key_vector("rotation_euler", 0, (0, 0, 0))
+    rise.key("location", 2, rise_dur, 0.0)
+    rise.key_vector("scale", rise_dur, (1, 1, 1))
+    num_spiral_steps = 20
+    t = np.arange(num_spiral_steps + 1) / num_spiral_steps
+    frames = (rise_dur + np.trunc(t * spiral_dur))[None, :]
+    angle = t * 2 * pi * 2
+    spiral = np.stack([0.5 * np.cos(angle) * (1 - t), 0.5 * np.sin(angle) * (1 - t), np.zeros_like(t)], axis=-1)
+    rise.key_vector("location", frames, spiral[None, :, :])
+    tumble = np.radians(np.stack([t * 360, t * 180, t * 720], axis=-1))
+    rise.key_vector("rotation_euler", frames, tumble[None, :, :])
+    rise.key_vector("location", rise_dur + spiral_dur, (0, 0, 0))
+    rise.key_vector("rotation_euler", rise_dur + spiral_dur, (0, 0, 0))
+
+    # Two dances, the second one mirrored
+    sway = np.radians([5, 5, 10])
+    dance = Motion(1)
+    for start, sign in ((0, 1), (dance_dur + delay_between_dances, -1)):
+        dance.key_vector("scale", start, (1.1, 1.1, 1.1))
+        dance.key_vector("rotation_euler", start, sign * sway)
+        dance.key_vector("scale", start + dance_dur // 2, (0.9, 0.9, 0.9))
+        dance.key_vector("rotation_euler", start + dance_dur // 2, -sign * sway)
+        if sign > 0:
+            dance.key_vector("scale", start + dance_dur, (1.1, 1.1, 1.1))
+            dance.key_vector("rotation_euler", start + dance_dur, sway)
+        else:
+            dance.key_vector("scale", start + dance_dur, (1, 1, 1))
+            dance.key_vector("rotation_euler", start + dance_dur, (0, 0, 0))
+
+    m = Motion(num_letters)
+    m.stagger(rise, appear_start_base + idx * interval)
+    m.stagger(dance, assemble_base + idx * 5)
+    return m
+
+def elastic_wave(num_letters, positions=None, rng=None, *, wave_interval=10):
+    wave = Motion(1)
+    wave.key_vector("scale", 0, (0, 0, 0))
+    wave.key_vector("scale", 10, (0.6, 0.6, 2.0))
+    wave.key_vector("scale", 20, (1.5, 1.5, 0.5))
+    wave.key_vector("scale", 28, (0.9, 0.9, 1.1))
+    wave.key_vector("scale", 35, (1.0, 1.0, 1.0))
+    wave.key("location", 2, 0, 0.0)
+    wave.key("location", 2, 10, 1.0)
+    wave.key("location", 2, 20, 0.0)
+
+    m = Motion(num_letters)
+    m.stagger(wave, 1 + np.arange(num_letters) * wave_interval)
+    return m
+
+def tumble_3d(num_letters, positions=None, rng=None, *, interval=10, tumble_dur=60):
+    tumble = Motion(1)
+    tumble.key_vector("scale", 0, (0, 0, 0))
+    tumble.key_vector("rotation_euler", 0, (2 * pi * 2, 2 * pi * 1.5, 0))
+    tumble.key_vector("scale", tumble_dur // 2, (1, 1, 1))
+    tumble.key_vector("rotation_euler", tumble_dur, (0, 0, 0))
+    tumble.key_vector("rotation_euler", tumble_dur + 5, (np.radians(-10), 0, 0))
+    tumble.key_vector("rotation_euler", tumble_dur + 15, (0, 0, 0))
+
+    idx = np.arange(num_letters)
+    start_frame = 1 + idx * interval
+    m = Motion(num_letters)
+    m.stagger(tumble, start_frame)
+    # Odd letters tumble the other way around Y
+    odd = idx % 2 == 1
+    m.key("rotation_euler", 1, start_frame, -2 * pi * 1.5, mask=odd[:, None])
+    return m
+
+def digital_glitch(num_letters, positions=None, rng=None, *, fall_dur=20, glitch_dur=30):
+    rng = _generator(rng)
+    fall = Motion(1)
+    fall.key("location", 2, 0, 10.0)
+    fall.key_vector("scale", 0, (0.5, 0.5, 3.0))
+    fall.key("location", 2, fall_dur, 0.0)
+    fall.key_vector("scale", fall_dur, (1, 1, 1))
+    fall.key_vector("location", fall_dur + glitch_dur + 5, (0, 0, 0))
+    fall.key_vector("scale", fall_dur + glitch_dur + 5, (1, 1, 1))
+
+    appear_start = 1 + np.arange(num_letters) * 5
+    m = Motion(num_letters)
+    m.stagger(fall, appear_start)
+
+    # Glitch keys every 2-4 frames until the glitch ends; draw the most a letter can need
+    impact_frame = appear_start + fall_dur
+    end_glitch = impact_frame + glitch_dur
+    max_steps = -(-glitch_dur // 2)
+    u = rng.random((num_letters, max_steps, 5))
+    steps = 2 + np.floor(u[..., 0] * 3)
+    frames = impact_frame[:, None] + np.cumsum(steps, axis=1)
+    mask = (frames - steps) < end_glitch[:, None]
+    jitter = _scale(u[..., 1:3], -0.2, 0.2)
+    stretch = _scale(u[..., 3:5], 0.8, 1.2)
+    zeros = np.zeros((num_letters, max_steps))
+    m.key_vector("location", frames, np.stack([jitter[..., 0], zeros, jitter[..., 1]], axis=-1), mask=mask)
+    m.key_vector("scale", frames, np.stack([stretch[..., 0], stretch[..., 1], zeros + 1], axis=-1), mask=mask)
+    return m
+
+def slingshot_snap(num_letters, positions=None, rng=None, *, tension_dur=40):
+    rng = _generator(rng)
+    snap = Motion(1)
+    snap.key("location", 2, 0, 0.0)
+    snap.key_vector("scale", 0, (1, 1, 1))
+    snap.key("location", 2, tension_dur, -5.0)
+    # Placeholder for the random wobble of each letter, keyed below
+    snap.key_vector("rotation_euler", tension_dur, (0, 0, 0))
+    snap_t = tension_dur + 4
+    snap.key("location", 2, snap_t, 2.0)
+    snap.key_vector("rotation_euler", snap_t, (0, 0, 0))
+    snap.key("location", 2, snap_t + 8, -0.5)
+    snap.key("location", 2, snap_t + 14, 0.0)
+
+    release_t = 1 + np.arange(num_letters) * 5 + tension_dur
+    m = Motion(num_letters)
+    m.stagger(snap, release_t - tension_dur)
+    wobble = np.radians(_scale(rng.random((num_letters, 2)), -5, 5))
+    m.key("rotation_euler", 0, release_t, wobble[:, 0])
+    m.key("rotation_euler", 1, release_t, wobble[:, 1])
+    return m
+
+def arcade_slam(num_letters, positions=None, rng=None, *, slam_dur=10, jitter_dur=30, pulse_period=20):
+    rng = _generator(rng)
+    slam = Motion(1)
+    # Phase 1: Meteor; the spin of each letter is keyed below
+    slam.key("location", 2, 0, -40.0)
+    slam.key_vector("scale", 0, (0.1, 0.1, 0.1))
+    slam.key_vector("rotation_euler", 0, (0, 0, 0))
+
+    # Phase 2: Impact, then jitter (placeholders, keyed below) and settle
+    impact_frame = slam_dur
+    slam.key("location", 2, impact_frame, 0.0)
+    slam.key_vector("rotation_euler", impact_frame, (0, 0, 0))
+    slam.key_vector("scale", impact_frame, (2.0, 2.0, 2.0))
+    slam.key_vector("scale", impact_frame + 4, (0.8, 0.8, 0.8))
+    settle_frame = impact_frame + 8
+    slam.key_vector("scale", settle_frame, (1.0, 1.0, 1.0))
+    jitter_end = settle_frame + jitter_dur
+    jitter_frames = settle_frame + 2 * np.arange(1, -(-jitter_dur // 2) + 1)
+    jitter_frames = jitter_frames[jitter_frames < jitter_end]
+    slam.key_vector("location", jitter_frames[None, :], (0, 0, 0))
+    slam.key_vector("location", jitter_end, (0, 0, 0))
+
+    # Phase 3: Pulse
+    for p in range(3):
+        base = jitter_end + p * pulse_period
+        slam.key_vector("scale", base, (1.0, 1.0, 1.0))
+        slam.key_vector("scale", base + 5, (1.15, 1.15, 1.15))
+        slam.key_vector("scale", base + 10, (1.0, 1.0, 1.0))
+
+    start_frame = 1 + np.arange(num_letters) * 2
+    m = Motion(num_letters)
+    m.stagger(slam, start_frame)
+    num_jitters = len(jitter_frames)
+    u = rng.random((num_letters, 3 + 2 * num_jitters))
+    m.key_vector("rotation_euler", start_frame, np.radians(_scale(u[:, :3], -720, 720)))
+    jitter = _scale(u[:, 3:].reshape(num_letters, num_jitters, 2), -0.1, 0.1)
+    frames = start_frame[:, None] + jitter_frames
+    m.key("location", 0, frames, jitter[..., 0])
+    m.key("location", 2, frames, jitter[..., 1])
+    return m
+
+PRESETS = {
+    'DAYTONA': daytona,
+    'CIRCULAR_APPROACH': circular_approach,
+    'BAD_GAME_OVER': bad_game_over,
+    'GOOD_GAME_OVER': good_game_over,
+    'ELASTIC_WAVE': elastic_wave,
+    '3D_TUMBLE': tumble_3d,
+    'DIGITAL_GLITCH': digital_glitch,
+    'SLINGSHOT_SNAP': slingshot_snap,
+    'ARCADE_SLAM': arcade_slam,
+}
+
+def reduce_keys(frames, values, tolerance):
+    """Returns a mask of the keys of one channel worth keeping (Ramer-Douglas-Peucker).
+
+    Keys are dropped while a straight line between the kept neighbours passes
+    within tolerance of them. frames must be sorted; the first and last keys
+    are always kept.
+    """
+    frames = np.asarray(frames, dtype=float)
+    values = np.asarray(values, dtype=float)
+    n = len(frames)
+    keep = np.zeros(n, dtype=bool)
+    keep[[0, -1] if n else []] = True
+    spans = [(0, n - 1)]
+    while spans:
+        lo, hi = spans.pop()
+        if hi - lo < 2:
+            continue
+        t = (frames[lo + 1:hi] - frames[lo]) / (frames[hi] - frames[lo])
+        errors = np.abs(values[lo + 1:hi] - (values[lo] + t * (values[hi] - values[lo])))
+        worst = int(np.argmax(errors))
+        if errors[worst] > tolerance:
+            mid = lo + 1 + worst
+            keep[mid] = True
+            spans += [(lo, mid), (mid, hi)]
+    return keep
+
+def parameters(anim_type):
+    """Returns the timing constants of preset anim_type with their default values."""
+    signature = inspect.signature(PRESETS[anim_type])
+    return {name: p.default for name, p in signature.parameters.items() if p.kind is p.KEYWORD_ONLY}
+
+def evaluate(anim_type, num_letters, positions=None, seed=0, **params):
+    """Returns the Motion of preset anim_type for num_letters letters.
+
+    seed starts the random stream of the title; the same seed gives the same motion.
+    """
+    try:
+        preset = PRESETS[anim_type]
+    except KeyError:
+        raise ValueError(f"Unknown animation type {anim_type!r}") from None
+    return preset(num_letters, positions, np.random.default_rng(seed), **params)
@@ -0,0 +1,101 @@
+"""The packed baked-animation format, checked without Blender."""
+
+import os
+import struct
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "game_over_text_animator"))
+
+import bake  # noqa: E402
+import presets  # noqa: E402
+
+HEADER = {"text": "GAME OVER", "fps": 60.0, "frame_start": 1, "frame_end": 24, "glyphs": ["G", "A"], "glyph_index": [0, 1, 0]}
+
+def samples(frames=24, letters=3, seed=0):
+    rng = np.random.default_rng(seed)
+    data = rng.normal(size=(frames, letters, 9)).cumsum(axis=0)
+    data[..., 6:9] = np.abs(data[..., 6:9])
+    return data.astype(np.float32)
+
+def test_float32_exact():
+    data = samples()
+    header, decoded = bake.decode(bake.encode(data, HEADER))
+    np.testing.assert_array_equal(decoded, data)
+    assert header["text"] == "GAME OVER"
+    assert header["shape"] == [24, 3, 9]
+    assert header["channels"] == list(bake.CHANNELS)
+
+def test_float16_close():
+    data = samples()
+    _, decoded = bake.decode(bake.encode(data, HEADER, 'FLOAT16'))
+    np.testing.assert_allclose(decoded, data, rtol=1e-3, atol=1e-3)
+
+@pytest.mark.parametrize("delta", [False, True])
+def test_int16_within_half_a_step(delta):
+    data = samples()
+    header, decoded = bake.decode(bake.encode(data, HEADER, 'INT16', delta))
+    step = np.array(header["step"], dtype=np.float32)
+    assert np.all(np.abs(decoded - data) <= step / 2 + 1e-5)
+
+def test_delta_decodes_like_plain():
+    data = samples()
+    _, plain = bake.decode(bake.encode(data, HEADER, 'INT16'))
+    _, delta = bake.decode(bake.encode(data, HEADER, 'INT16', delta=True))
+    np.testing.assert_array_equal(plain, delta)
+
+def test_constant_component():
+    data = np.ones((5, 2, 9), dtype=np.float32)
+    _, decoded = bake.decode(bake.encode(data, HEADER, 'INT16', delta=True))
+    np.testing.assert_allclose(decoded, data)
+
+def test_layout():
+    buffer = bake.encode(samples(), HEADER)
+    assert buffer[:4] == bake.MAGIC
+    version, length = struct.unpack_from("<II", buffer, 4)
+    assert version == bake.VERSION
+    assert (12 + length) % 16 == 0
+    assert len(buffer) == 12 + length + 24 * 3 * 9 * 4
+
+def test_rejects_bad_input():
+    with pytest.raises(ValueError):
+        bake.encode(samples(), HEADER, 'FLOAT64')
+    with pytest.raises(ValueError):
+        bake.encode(samples(), HEADER, 'FLOAT32', delta=True)
+    with pytest.raises(ValueError):
+        bake.decode(b"NOPE" + bytes(12))
+
+def test_unique_poses_and_runs():
+    # Values on a coarse grid, so the tiny offset below can't cross a rounding boundary
+    pose_a, pose_b = np.round(samples(1, seed=1)[0], 2), np.round(samples(1, seed=2)[0], 2)
+    data = np.stack([pose_a, pose_a, pose_b, pose_b + 1e-7, pose_a])
+    pose, first = bake.unique_poses(data)
+    assert pose.tolist() == [0, 0, 1, 1, 0]
+    assert first.tolist() == [0, 2]
+    assert bake.pose_runs(pose) == [(0, 1), (2, 3), (4, 4)]
+    assert bake.pose_runs([]) == []
+
+def test_late_chunk_hidden_until_it_appears():
+    # DAYTONA scales letter i up from 0.001 starting at frame 1 + 4 i
+    motion = presets.evaluate('DAYTONA', 8)
+    letters, frames, values, _ = motion.channels()[("scale", 0)]
+    timeline = np.arange(1, motion.frame_end + 1)
+    data = np.zeros((len(timeline), 8, 9))
+    for i in range(8):
+        data[:, i, 6:9] = np.interp(timeline, frames[letters == i], values[letters == i])[:, None]
+    hidden = bake.hidden_chunks(bake.shown_letters(data), 4)
+    assert hidden.shape == (len(timeline), 2)
+    assert not hidden[:, 0].any()
+    # Letter 4 grows from frame 17 on, so it is seen from frame 18 and the
+    # margin shows its chunk a frame early
+    assert hidden[:16, 1].all()
+    assert not hidden[16:, 1].any()
+
+def test_hidden_chunks_margin():
+    shown = np.zeros((10, 3), dtype=bool)
+    shown[5, 2] = True
+    hidden = bake.hidden_chunks(shown, 2, margin=2)
+    assert hidden[:, 0].all()
+    assert hidden[:, 1].tolist() == [True] * 3 + [False] * 5 + [True] * 2
@@ -0,0 +1,113 @@
+"""Preset motion, checked without Blender.
+
+GOLDEN holds, per preset and letter count: the number of channels, the
+number of keys, frame_end, and the sums of all key frames and values. They
+were recorded from the presets after checking them key by key against the
+per-bone keyframe_insert code the presets replaced.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "game_over_text_animator"))
+
+import presets  # noqa: E402
+
+GOLDEN = {
+    ('DAYTONA', 1): (7, 34, 358, 2462.0, 38.6939),
+    ('DAYTONA', 3): (7, 102, 382, 8034.0, 116.0818),
+    ('DAYTONA', 8): (7, 272, 442, 25744.0, 309.5514),
+    ('CIRCULAR_APPROACH', 1): (7, 191, 156, 12607.0, -249.8559),
+    ('CIRCULAR_APPROACH', 3): (7, 573, 286, 75126.0, -749.5678),
+    ('CIRCULAR_APPROACH', 8): (7, 1528, 611, 449036.0, -1998.8474),
+    ('BAD_GAME_OVER', 1): (7, 34, 131, 2022.0, 16.7416),
+    ('BAD_GAME_OVER', 3): (7, 102, 171, 8496.0, 50.2248),
+    ('BAD_GAME_OVER', 8): (7, 272, 271, 38856.0, 133.9327),
+    ('GOOD_GAME_OVER', 1): (9, 179, 246, 19679.0, 250.0755),
+    ('GOOD_GAME_OVER', 3): (9, 537, 286, 69252.0, 750.2266),
+    ('GOOD_GAME_OVER', 8): (9, 1432, 386, 252772.0, 2000.6044),
+    ('ELASTIC_WAVE', 1): (4, 18, 36, 327.0, 13.6),
+    ('ELASTIC_WAVE', 3): (4, 54, 56, 1521.0, 40.8),
+    ('ELASTIC_WAVE', 8): (4, 144, 106, 7656.0, 108.8),
+    ('3D_TUMBLE', 1): (6, 18, 76, 708.0, 24.8166),
+    ('3D_TUMBLE', 3): (6, 55, 96, 2675.0, 65.0251),
+    ('3D_TUMBLE', 8): (6, 148, 146, 10868.0, 160.8338),
+    ('DIGITAL_GLITCH', 1): (6, 74, 56, 2710.0, 50.3712),
+    ('DIGITAL_GLITCH', 3): (6, 222, 66, 9336.0, 152.6706),
+    ('DIGITAL_GLITCH', 8): (6, 592, 91, 32238.0, 403.4817),
+    ('SLINGSHOT_SNAP', 1): (7, 16, 59, 542.0, -0.5163),
+    ('SLINGSHOT_SNAP', 3): (7, 48, 69, 1866.0, -1.5541),
+    ('SLINGSHOT_SNAP', 8): (7, 128, 94, 6576.0, -3.9791),
+    ('ARCADE_SLAM', 1): (9, 123, 99, 4714.0, -13.476),
+    ('ARCADE_SLAM', 3): (9, 369, 103, 14880.0, -32.6462),
+    ('ARCADE_SLAM', 8): (9, 984, 113, 44600.0, 30.7486),
+}
+
+RANDOM_PRESETS = ('DIGITAL_GLITCH', 'SLINGSHOT_SNAP', 'ARCADE_SLAM')
+
+def summary(motion):
+    channels = motion.channels()
+    return (len(channels),
+            sum(len(letters) for letters, _, _, _ in channels.values()),
+            motion.frame_end,
+            round(sum(float(frames.sum()) for _, frames, _, _ in channels.values()), 4),
+            round(sum(float(values.sum()) for _, _, values, _ in channels.values()), 4))
+
+def assert_same_motion(a, b):
+    a, b = a.channels(), b.channels()
+    assert list(a) == list(b)
+    for channel in a:
+        for x, y in zip(a[channel], b[channel]):
+            np.testing.assert_array_equal(x, y)
+
+@pytest.mark.parametrize("anim_type, num_letters", sorted(GOLDEN))
+def test_golden(anim_type, num_letters):
+    assert summary(presets.evaluate(anim_type, num_letters)) == GOLDEN[(anim_type, num_letters)]
+
+@pytest.mark.parametrize("anim_type", sorted(presets.PRESETS))
+def test_every_letter_keyed(anim_type):
+    for letters, frames, values, phases in presets.evaluate(anim_type, 5).channels().values():
+        assert np.all(np.diff(letters) >= 0)
+        assert len(frames) == len(values) == len(phases) == len(letters)
+    keyed = set()
+    for letters, _, _, _ in presets.evaluate(anim_type, 5).channels().values():
+        keyed.update(letters.tolist())
+    assert keyed == set(range(5))
+
+def test_no_letters():
+    for anim_type in presets.PRESETS:
+        motion = presets.evaluate(anim_type, 0)
+        assert summary(motion)[1] == 0
+        assert motion.frame_end == 1
+
+@pytest.mark.parametrize("anim_type", sorted(presets.PRESETS))
+def test_same_seed_same_motion(anim_type):
+    assert_same_motion(presets.evaluate(anim_type, 6, seed=7), presets.evaluate(anim_type, 6, seed=7))
+
+@pytest.mark.parametrize("anim_type", RANDOM_PRESETS)
+def test_seed_varies_random_presets(anim_type):
+    with pytest.raises(AssertionError):
+        assert_same_motion(presets.evaluate(anim_type, 6, seed=1), presets.evaluate(anim_type, 6, seed=2))
+
+@pytest.mark.parametrize("anim_type", sorted(set(presets.PRESETS) - set(RANDOM_PRESETS)))
+def test_seed_ignored_by_fixed_presets(anim_type):
+    assert_same_motion(presets.evaluate(anim_type, 6, seed=1), presets.evaluate(anim_type, 6, seed=2))
+
+@pytest.mark.parametrize("anim_type", sorted(presets.PRESETS))
+def test_positions_ignored(anim_type):
+    # The action cache keys on the letter count alone
+    assert_same_motion(presets.evaluate(anim_type, 4, np.zeros(4)), presets.evaluate(anim_type, 4, np.array([-3.0, -1.0, 0.5, 4.0])))
+
+def test_unknown_preset():
+    with pytest.raises(ValueError):
+        presets.evaluate('NOT_A_PRESET', 3)
+
+def test_reduce_keys_keeps_ends_and_corners():
+    frames = np.arange(11, dtype=float)
+    values = np.concatenate((np.linspace(0, 1, 6), np.linspace(0.8, 0, 5)))
+    keep = presets.reduce_keys(frames, values, 1e-3)
+    assert keep[0] and keep[-1] and keep[5]
+    assert keep.sum() == 3
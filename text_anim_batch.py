@@ -0,0 +1,212 @@
+"""Headless batch generation for the Game Over Text Animator.
+
+Run inside Blender in background mode:
+
+    blender -b -P text_anim_batch.py -- jobs.json
+    blender -b -P text_anim_batch.py -- jobs.csv --save titles.blend
+
+The manifest is a JSON list of job objects or a CSV file with a header row.
+Each job has the fields:
+
+    text     the title to generate (required)
+    font     path to a font file; empty for Blender's built-in font
+    preset   an Animation Type identifier such as DAYTONA (default) or ARCADE_SLAM
+    spacing  extra letter spacing (default 0.0)
+    seed     random variation of the glitch, slingshot and slam presets
+             (default 0); the same seed gives the same title on every worker
+    output   a .blend path to write the title to on its own, or the name of
+             the collection to generate it into (default: the text)
+    frame_start, frame_end
+             optional frame range to render (default: the whole animation)
+
+With --render DIR every title is also rendered to an image sequence in
+DIR/<output name>/ using the camera, lights and output format of the opened
+file, so pass a template scene before -P:
+
+    blender -b template.blend -P text_anim_batch.py -- jobs.json --render frames/
+
+After each job its generation stats (seconds per stage and counts of
+glyphs, vertices, bones, F-curves and keyframes) are printed as one line of
+JSON; the same record is stored in the "text_anim_stats" property of the
+title's group empty.
+
+Fonts and glyph data are loaded once and shared by all jobs of a run; the
+glyph widths of every font are measured for all its jobs' characters up
+front. With --cache DIR the generated actions are also kept on disk and
+reused by later runs (and other workers) that generate the same preset for
+the same number of letters. To spread a manifest over several Blender processes, see
+text_anim_farm.py.
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+
+import bpy
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import game_over_text_animator as text_anim
+
+PRESETS = [item[0] for item in text_anim.ANIMATION_TYPES]
+
+def read_manifest(path):
+    if path.lower().endswith(".csv"):
+        with open(path, newline="", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+    else:
+        with open(path, encoding="utf-8") as f:
+            rows = json.load(f)
+    return [normalize_job(row) for row in rows]
+
+def normalize_job(row):
+    text = (row.get("text") or "").strip()
+    if not text:
+        raise ValueError(f"Job without text: {row!r}")
+    preset = (row.get("preset") or "DAYTONA").strip().upper()
+    if preset not in PRESETS:
+        raise ValueError(f"Unknown preset {preset!r} for {text!r}, expected one of {', '.join(PRESETS)}")
+    return {
+        "text": text,
+        "font": (row.get("font") or "").strip(),
+        "preset": preset,
+        "spacing": float(row.get("spacing") or 0.0),
+        "seed": int(row.get("seed") or 0),
+        "output": (row.get("output") or "").strip() or text,
+        "frame_start": int(row["frame_start"]) if row.get("frame_start") not in (None, "") else None,
+        "frame_end": int(row["frame_end"]) if row.get("frame_end") not in (None, "") else None,
+    }
+
+def write_title_blend(context, collection, filepath):
+    """Writes collection into filepath as the only content of a scene of its own."""
+    scene = bpy.data.scenes.new(collection.name)
+    scene.collection.children.link(collection)
+    src = context.scene
+    scene.render.fps = src.render.fps
+    scene.render.fps_base = src.render.fps_base
+    scene.frame_start = src.frame_start
+    scene.frame_end = src.frame_end
+    os.makedirs(os.path.dirname(filepath) or ".", exist_ok=True)
+    bpy.data.libraries.write(filepath, {scene}, path_remap='ABSOLUTE')
+    bpy.data.scenes.remove(scene)
+
+def discard_collection(collection):
+    """Removes collection, its objects and whatever data only they used."""
+    data = set()
+    for obj in collection.objects:
+        if obj.data is not None:
+            data.add(obj.data)
+        if obj.animation_data and obj.animation_data.action:
+            data.add(obj.animation_data.action)
+    bpy.data.batch_remove(list(collection.objects) + [collection])
+    bpy.data.batch_remove([block for block in data if block.users == 0])
+
+def render_title(context, collection, directory, frame_start=None, frame_end=None, hidden=()):
+    """Renders the scene's animation to an image sequence in directory with only collection visible.
+
+    The range is clipped to the frames the title animates over. Frames where
+    the title holds still are rendered once and linked for the rest of the
+    hold. Returns the rendered (first, last) frames, or None if the range is
+    empty.
+    """
+    scene = context.scene
+    saved = (scene.frame_start, scene.frame_end, scene.render.filepath)
+    first = max(frame_start, scene.frame_start) if frame_start is not None else scene.frame_start
+    last = min(frame_end, scene.frame_end) if frame_end is not None else scene.frame_end
+    if first > last:
+        return None
+
+    for other in hidden:
+        other.hide_render = True
+    try:
+        scene.frame_start = first
+        scene.frame_end = last
+        scene.render.filepath = os.path.join(os.path.abspath(directory), "")
+        empty = next((obj for obj in collection.objects if text_anim.read_title_state(obj) is not None), None)
+        if empty is None or scene.render.is_movie_format:
+            bpy.ops.render.render(animation=True)
+        else:
+            text_anim.render_sequence(context, empty)
+    finally:
+        scene.frame_start, scene.frame_end, scene.render.filepath = saved
+        for other in hidden:
+            other.hide_render = False
+    return first, last
+
+def run_job(context, job, render_dir=None, keep=True, hidden=(), cache=None, key_tolerance=0.0, chunk_size=0):
+    """Generates one job. Returns its collection if it stays in the session, otherwise None."""
+    font = text_anim.load_font(job["font"])
+    output = job["output"]
+    to_blend = output.lower().endswith(".blend")
+    name = os.path.splitext(os.path.basename(output))[0] if to_blend else output
+
+    collection = bpy.data.collections.new(name)
+    context.scene.collection.children.link(collection)
+    stats = text_anim.GenerationStats()
+    text_anim.generate_title(context, job["text"], font, job["preset"], job["spacing"], collection=collection,
+                             stats=stats, seed=job["seed"], cache=cache, key_tolerance=key_tolerance,
+                             chunk_size=chunk_size)
+    print(f"  {json.dumps(stats.as_dict())}")
+    if render_dir:
+        render_title(context, collection, os.path.join(render_dir, name), job["frame_start"], job["frame_end"], hidden)
+    if to_blend:
+        write_title_blend(context, collection, os.path.abspath(output))
+    if to_blend or not keep:
+        discard_collection(collection)
+        return None
+    return collection
+
+def prewarm_fonts(context, jobs):
+    """Measures every character the jobs use, once per font, before the first job runs."""
+    charsets = {}
+    for job in jobs:
+        charsets.setdefault(job["font"], set()).update(job["text"].upper())
+    for font_path, chars in charsets.items():
+        try:
+            font = text_anim.load_font(font_path)
+        except ValueError:
+            continue  # reported by the jobs that use it
+        text_anim.prewarm_glyph_metrics(context, font, sorted(chars))
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog="blender -b -P text_anim_batch.py --",
+                                     description="Generate animated titles from a JSON or CSV job manifest.")
+    parser.add_argument("manifest", help="JSON or CSV job manifest")
+    parser.add_argument("--save", metavar="BLEND", help="save the session (all collection outputs) to this .blend at the end")
+    parser.add_argument("--render", metavar="DIR", help="render every title to an image sequence in DIR/<output name>/")
+    parser.add_argument("--key-tolerance", type=float, default=0.0, metavar="T", help="thin out sampled keys within this tolerance (default: keep all)")
+    parser.add_argument("--chunk-size", type=int, default=0, metavar="N", help="split rigs into armatures of N bones, hidden while off camera (default: one armature)")
+    parser.add_argument("--cache", metavar="DIR", help="keep generated actions in DIR and reuse them across runs")
+    parser.add_argument("--cache-size", type=int, default=256, metavar="MB", help="size limit of the action cache (default: 256)")
+    return parser.parse_args(argv)
+
+def main(argv):
+    args = parse_args(argv)
+    jobs = read_manifest(args.manifest)
+    context = bpy.context
+    # Rendered titles leave the session afterwards unless it gets saved
+    keep = bool(args.save) or not args.render
+    cache = text_anim.ActionCache(os.path.abspath(args.cache), args.cache_size * 2**20) if args.cache else None
+    prewarm_fonts(context, jobs)
+    kept = []
+    failed = 0
+    for n, job in enumerate(jobs, 1):
+        try:
+            collection = run_job(context, job, args.render, keep, kept, cache, args.key_tolerance, args.chunk_size)
+            if collection is not None:
+                kept.append(collection)
+        except Exception as exc:
+            failed += 1
+            print(f"[{n}/{len(jobs)}] FAILED {job['text']!r}: {exc}")
+        else:
+            print(f"[{n}/{len(jobs)}] {job['text']!r} ({job['preset']}) -> {job['output']}")
+
+    if args.save:
+        bpy.ops.wm.save_as_mainfile(filepath=os.path.abspath(args.save))
+    print(f"{len(jobs) - failed} of {len(jobs)} jobs done")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    sys.exit(main(argv))
@@ -0,0 +1,210 @@
+"""Benchmarks title generation and playback of the Game Over Text Animator.
+
+Runs the object.text_anim_run operator headless over a matrix of presets,
+text lengths and fonts, in Blender's background mode or with the bpy module:
+
+    blender -b --factory-startup -P text_anim_bench.py -- --out results.json
+    blender -b --factory-startup -P text_anim_bench.py -- --font heavy_outline.ttf --out new.json --baseline old.json
+
+Every case starts from an empty file with cold glyph caches. For each case
+the results record:
+
+    seconds     wall time of the operator (best of --repeat runs)
+    stages      seconds per generation stage and the work counts (text_anim_stats)
+    datablocks  datablocks added per type
+    playback    milliseconds per frame_set() (depsgraph evaluation) over
+                --playback-frames frames spread across the animation
+    python_peak peak Python heap during generation, in bytes (with --memory,
+                measured in an extra run so tracemalloc doesn't skew the timing)
+    rss_growth  growth of the process peak resident set during that extra run,
+                in bytes. Unlike python_peak it includes the mesh, curve and
+                action datablocks. The process peak never drops, so a case
+                that stays below an earlier case's peak shows 0; run single
+                cases (--presets, --lengths) for absolute figures
+
+The default matrix is all nine presets, lengths 5, 50 and 500, and Blender's
+built-in font plus every --font given. With --baseline the run is compared
+case by case against an earlier results file. A saved pair of results files
+can be compared without Blender:
+
+    python text_anim_bench.py --compare new.json old.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+DEFAULT_LENGTHS = (5, 50, 500)
+SAMPLE_TEXT = "GAME OVER! CONTINUE? INSERT COIN "
+DATABLOCK_TYPES = ("objects", "meshes", "curves", "armatures", "actions", "materials", "fonts", "texts")
+
+def sample_text(length):
+    return (SAMPLE_TEXT * (length // len(SAMPLE_TEXT) + 1))[:length]
+
+def count_datablocks(bpy):
+    return {name: len(getattr(bpy.data, name)) for name in DATABLOCK_TYPES}
+
+def peak_rss():
+    """Returns the peak resident set of this process in bytes, or None where it can't be read."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+def time_playback(bpy, scene, frames):
+    """Returns (mean, max) milliseconds per frame_set() over frames sampled across the scene range."""
+    first, last = scene.frame_start, scene.frame_end
+    step = max((last - first + 1) // max(frames, 1), 1)
+    times = []
+    for frame in range(first, last + 1, step):
+        started = time.perf_counter()
+        scene.frame_set(frame)
+        times.append((time.perf_counter() - started) * 1000.0)
+    return (sum(times) / len(times), max(times)) if times else (0.0, 0.0)
+
+def run_case(bpy, text_anim, preset, length, font_path, args):
+    """Generates one title args.repeat times from an empty file and returns its result dict."""
+    best = None
+    for run in range(args.repeat + (1 if args.memory else 0)):
+        measure_memory = args.memory and run == args.repeat
+        bpy.ops.wm.read_homefile(use_empty=True)
+        text_anim.clear_glyph_metrics()
+        scene = bpy.context.scene
+        scene.text_anim_input = sample_text(length)
+        scene.text_anim_font = font_path
+        scene.text_anim_type = preset
+        scene.text_anim_profile = False
+        scene.text_anim_update = False
+        before = count_datablocks(bpy)
+
+        if measure_memory:
+            rss_before = peak_rss()
+            tracemalloc.start()
+        started = time.perf_counter()
+        result = bpy.ops.object.text_anim_run()
+        seconds = time.perf_counter() - started
+        if measure_memory:
+            best["python_peak"] = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            rss_after = peak_rss()
+            best["rss_growth"] = rss_after - rss_before if rss_before is not None else None
+            continue
+        if result != {'FINISHED'}:
+            raise RuntimeError(f"text_anim_run returned {result}")
+
+        if best is None or seconds < best["seconds"]:
+            empty = bpy.context.view_layer.objects.active
+            after = count_datablocks(bpy)
+            mean_ms, max_ms = time_playback(bpy, scene, args.playback_frames)
+            best = {
+                "seconds": round(seconds, 6),
+                "stages": json.loads(empty["text_anim_stats"]),
+                "datablocks": {name: after[name] - before[name] for name in DATABLOCK_TYPES},
+                "frames": scene.frame_end - scene.frame_start + 1,
+                "playback": {"mean_ms": round(mean_ms, 4), "max_ms": round(max_ms, 4)},
+            }
+    best.update(preset=preset, length=length, font=os.path.basename(font_path) if font_path else "builtin")
+    return best
+
+def case_key(result):
+    return (result["preset"], result["length"], result["font"])
+
+def compare(results, baseline):
+    """Prints the change of every case against baseline. Returns (faster, slower) case counts."""
+    old = {case_key(r): r for r in baseline["results"]}
+    faster = slower = 0
+    print(f"{'preset':<18} {'len':>4} {'font':<14} {'gen s':>9} {'was':>9} {'ratio':>6} {'play ms':>9} {'was':>9} {'ratio':>6}")
+    for r in results["results"]:
+        b = old.get(case_key(r))
+        if b is None:
+            continue
+        gen = r["seconds"] / b["seconds"] if b["seconds"] else 1.0
+        play = r["playback"]["mean_ms"] / b["playback"]["mean_ms"] if b["playback"]["mean_ms"] else 1.0
+        faster += gen < 0.95
+        slower += gen > 1.05
+        print(f"{r['preset']:<18} {r['length']:>4} {r['font'][:14]:<14} {r['seconds']:>9.3f} {b['seconds']:>9.3f} {gen:>6.2f}"
+              f" {r['playback']['mean_ms']:>9.2f} {b['playback']['mean_ms']:>9.2f} {play:>6.2f}")
+    return faster, slower
+
+def run_benchmarks(args):
+    import bpy
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    import game_over_text_animator as text_anim
+    if not hasattr(bpy.types.Scene, "text_anim_input"):
+        text_anim.register()
+
+    presets = args.presets or [item[0] for item in text_anim.ANIMATION_TYPES]
+    fonts = [""] + [os.path.abspath(path) for path in args.font]
+    results = []
+    for font_path in fonts:
+        for length in args.lengths:
+            for preset in presets:
+                result = run_case(bpy, text_anim, preset, length, font_path, args)
+                results.append(result)
+                memory = ""
+                if "python_peak" in result:
+                    memory = f" python peak {result['python_peak'] / 2**20:.1f} MB"
+                    if result["rss_growth"] is not None:
+                        memory += f" rss +{result['rss_growth'] / 2**20:.1f} MB"
+                print(f"{preset:<18} {length:>4} {result['font']:<14} {result['seconds']:.3f}s"
+                      f" playback {result['playback']['mean_ms']:.2f} ms/frame{memory}")
+    return {
+        "meta": {
+            "blender": bpy.app.version_string,
+            "addon": ".".join(map(str, text_anim.bl_info["version"])),
+            "python": platform.python_version(),
+            "machine": platform.platform(),
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog="blender -b --factory-startup -P text_anim_bench.py --",
+                                     description="Benchmark title generation and playback.")
+    parser.add_argument("--out", metavar="JSON", help="write the results to this file")
+    parser.add_argument("--baseline", metavar="JSON", help="compare the results against an earlier results file")
+    parser.add_argument("--compare", nargs=2, metavar=("NEW", "OLD"), help="only compare two results files (no Blender needed)")
+    parser.add_argument("--presets", nargs="+", help="presets to run (default: all)")
+    parser.add_argument("--lengths", nargs="+", type=int, default=list(DEFAULT_LENGTHS), help="text lengths (default: 5 50 500)")
+    parser.add_argument("--font", action="append", default=[], help="font file to run besides the built-in font; can be repeated")
+    parser.add_argument("--repeat", type=int, default=1, help="runs per case; the fastest counts (default: 1)")
+    parser.add_argument("--playback-frames", type=int, default=100, help="frames sampled for playback timing (default: 100)")
+    parser.add_argument("--memory", action="store_true", help="also measure the peak Python heap and process memory growth of every case")
+    args = parser.parse_args(argv)
+    args.repeat = max(args.repeat, 1)
+    return args
+
+def main(argv):
+    args = parse_args(argv)
+    if args.compare:
+        with open(args.compare[0], encoding="utf-8") as f:
+            results = json.load(f)
+        with open(args.compare[1], encoding="utf-8") as f:
+            baseline = json.load(f)
+    else:
+        results = run_benchmarks(args)
+        if args.out:
+            with open(args.out, "w", encoding="utf-8") as f:
+                json.dump(results, f, indent=1)
+        if not args.baseline:
+            return 0
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+    faster, slower = compare(results, baseline)
+    print(f"{faster} cases faster, {slower} slower (generation time, 5% margin)")
+    return 0
+
+if __name__ == "__main__":
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else sys.argv[1:]
+    sys.exit(main(argv))
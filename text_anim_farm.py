@@ -0,0 +1,157 @@
+"""Spreads a batch manifest over several background Blender processes.
+
+Generating a title is mostly single-threaded Python, so one Blender process
+leaves most of a large machine idle. This scheduler splits the jobs of a
+text_anim_batch.py manifest into shards and runs each shard in its own
+`blender -b` worker, then collects the exit status of every worker:
+
+    python text_anim_farm.py jobs.json --workers 8 --render frames/ --template scene.blend
+
+Jobs with an explicit frame_start/frame_end can also be split into frame
+chunks (--frame-chunk) so that a single long title renders on several
+workers at once; every chunk regenerates the title and renders its part of
+the sequence into the same directory.
+
+This script runs with a plain Python interpreter and doesn't need bpy.
+"""
+
+import argparse
+import csv
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+BATCH_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "text_anim_batch.py")
+
+def read_rows(path):
+    if path.lower().endswith(".csv"):
+        with open(path, newline="", encoding="utf-8") as f:
+            return list(csv.DictReader(f))
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+def split_frames(rows, chunk):
+    """Splits rows with an explicit frame range into rows of at most chunk frames."""
+    tasks = []
+    for row in rows:
+        start, end = row.get("frame_start"), row.get("frame_end")
+        if not chunk or start in (None, "") or end in (None, ""):
+            tasks.append(row)
+            continue
+        start, end = int(start), int(end)
+        output = (row.get("output") or "").strip() or row.get("text", "")
+        for first in range(start, end + 1, chunk):
+            part = dict(row, frame_start=first, frame_end=min(first + chunk - 1, end))
+            if first != start and output.lower().endswith(".blend"):
+                # Only the first chunk writes the .blend; the rest render into the same directory
+                part["output"] = os.path.splitext(os.path.basename(output))[0]
+            tasks.append(part)
+    return tasks
+
+def estimate_cost(row):
+    cost = max(len(row.get("text", "")), 1)
+    if row.get("frame_start") not in (None, "") and row.get("frame_end") not in (None, ""):
+        cost *= int(row["frame_end"]) - int(row["frame_start"]) + 1
+    return cost
+
+def make_shards(tasks, workers):
+    """Balances tasks over at most workers shards, most expensive first."""
+    shards = [[] for _ in range(min(workers, len(tasks)))]
+    loads = [0] * len(shards)
+    for task in sorted(tasks, key=estimate_cost, reverse=True):
+        n = loads.index(min(loads))
+        shards[n].append(task)
+        loads[n] += estimate_cost(task)
+    return shards
+
+def worker_command(args, shard_path):
+    cmd = [args.blender, "-b"]
+    if args.template:
+        cmd.append(os.path.abspath(args.template))
+    else:
+        cmd.append("--factory-startup")
+    cmd += ["-noaudio", "-t", str(args.threads), "-P", BATCH_SCRIPT, "--", shard_path]
+    if args.render:
+        cmd += ["--render", os.path.abspath(args.render)]
+    if args.key_tolerance:
+        cmd += ["--key-tolerance", str(args.key_tolerance)]
+    if args.chunk_size:
+        cmd += ["--chunk-size", str(args.chunk_size)]
+    if args.cache:
+        cmd += ["--cache", os.path.abspath(args.cache), "--cache-size", str(args.cache_size)]
+    return cmd
+
+def run_shards(args, shards, work_dir):
+    """Starts one worker per shard and waits for all of them. Returns one result dict per worker."""
+    running = []
+    for n, shard in enumerate(shards):
+        shard_path = os.path.join(work_dir, f"shard_{n}.json")
+        with open(shard_path, "w", encoding="utf-8") as f:
+            json.dump(shard, f, indent=1)
+        log_path = os.path.join(work_dir, f"shard_{n}.log")
+        log = open(log_path, "w", encoding="utf-8")
+        proc = subprocess.Popen(worker_command(args, shard_path), stdout=log, stderr=subprocess.STDOUT)
+        running.append((n, proc, log, log_path, time.perf_counter()))
+
+    results = []
+    for n, proc, log, log_path, started in running:
+        returncode = proc.wait()
+        log.close()
+        results.append({
+            "shard": n,
+            "jobs": [job.get("text", "") for job in shards[n]],
+            "returncode": returncode,
+            "seconds": round(time.perf_counter() - started, 3),
+            "log": log_path,
+        })
+    return results
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Run a text_anim_batch.py manifest on several Blender workers.")
+    parser.add_argument("manifest", help="JSON or CSV job manifest")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="number of Blender processes (default: one per core)")
+    parser.add_argument("--blender", default=shutil.which("blender") or "blender", help="Blender executable")
+    parser.add_argument("--template", metavar="BLEND", help="scene each worker opens (camera, lights, render settings)")
+    parser.add_argument("--render", metavar="DIR", help="render every title to an image sequence in DIR/<output name>/")
+    parser.add_argument("--frame-chunk", type=int, default=0, metavar="N", help="split jobs with a frame range into chunks of N frames")
+    parser.add_argument("--key-tolerance", type=float, default=0.0, metavar="T", help="thin out sampled keys within this tolerance (default: keep all)")
+    parser.add_argument("--chunk-size", type=int, default=0, metavar="N", help="split rigs into armatures of N bones, hidden while off camera (default: one armature)")
+    parser.add_argument("--cache", metavar="DIR", help="action cache directory shared by all workers")
+    parser.add_argument("--cache-size", type=int, default=256, metavar="MB", help="size limit of the action cache (default: 256)")
+    parser.add_argument("--threads", type=int, default=0, help="render threads per worker (default: cores / workers)")
+    parser.add_argument("--work-dir", help="where shard manifests and worker logs go (default: a temporary directory)")
+    parser.add_argument("--report", metavar="JSON", help="write the per-worker results to this file")
+    args = parser.parse_args(argv)
+    args.workers = max(args.workers, 1)
+    if not args.threads:
+        args.threads = max((os.cpu_count() or 1) // args.workers, 1)
+    return args
+
+def main(argv):
+    args = parse_args(argv)
+    tasks = split_frames(read_rows(args.manifest), args.frame_chunk)
+    if not tasks:
+        print("Nothing to do")
+        return 0
+    work_dir = args.work_dir or tempfile.mkdtemp(prefix="text_anim_farm_")
+    os.makedirs(work_dir, exist_ok=True)
+
+    shards = make_shards(tasks, args.workers)
+    print(f"{len(tasks)} tasks on {len(shards)} workers, logs in {work_dir}")
+    results = run_shards(args, shards, work_dir)
+
+    failed = [r for r in results if r["returncode"] != 0]
+    for r in results:
+        status = "ok" if r["returncode"] == 0 else f"FAILED ({r['returncode']})"
+        print(f"worker {r['shard']}: {len(r['jobs'])} tasks, {r['seconds']}s, {status}")
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump({"tasks": len(tasks), "workers": results}, f, indent=1)
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))